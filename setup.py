@@ -35,5 +35,9 @@ setuptools.setup(
         'pandas',
         'pypdf2',
     ],
+    extras_require={
+        'pypdf': ['pypdf'],
+        'pdfminer': ['pdfminer.six'],
+    },
     python_requires='>=3.6',
 )
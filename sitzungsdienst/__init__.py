@@ -1,9 +1,11 @@
 from .sta import Sitzungsdienst
-from .utils import dump_csv, dump_json, dump_ics
+from .utils import dump_csv, dump_json, dump_jsonl, dump_ics, dump_data
 
 __all__ = [
     'Sitzungsdienst',
     'dump_csv',
     'dump_json',
+    'dump_jsonl',
     'dump_ics',
+    'dump_data',
 ]
@@ -0,0 +1,220 @@
+from abc import ABC, abstractmethod
+from io import BufferedReader
+
+
+class Backend(ABC):
+    """
+    This class represents a PDF text extraction backend,
+    turning each page of a PDF file into plain text
+    """
+
+    # Library name, as used on the command line
+    name = None
+
+
+    @abstractmethod
+    def load_pages(self, pdf_file: BufferedReader) -> list:
+        """
+        Loads page objects from given PDF file
+        """
+
+
+    @abstractmethod
+    def extract_text(self, page) -> str:
+        """
+        Extracts plain text from given page object
+        """
+
+
+    def count_pages(self, pdf_file: BufferedReader) -> int:
+        """
+        Counts pages of given PDF file
+        """
+
+        return len(list(self.load_pages(pdf_file)))
+
+
+    @abstractmethod
+    def load_content(self, page) -> bytes:
+        """
+        Loads (decoded) content stream of given page object
+        """
+
+
+    def hash_page(self, page) -> str:
+        """
+        Hashes content stream of given page object
+
+        Resources (eg fonts & their encodings) are not included,
+        so re-issued pages keeping their content stream but
+        swapping fonts will be served from cache (if enabled)
+        """
+
+        # Import library
+        from hashlib import sha1
+
+        # Include backend, since their text output differs
+        return sha1(self.name.encode('utf-8') + self.load_content(page)).hexdigest()
+
+
+    def extract_pages(self, pdf_file: BufferedReader, cache = None, first: int = 0, last: int = None):
+        """
+        Extracts plain text from PDF file, yielding each page
+        (from `first` up to `last`) as list of stripped text lines
+        """
+
+        for number, page in enumerate(self.load_pages(pdf_file)):
+            # Skip pages before first one ..
+            if number < first:
+                continue
+
+            # .. and stop after last one
+            if last is not None and number >= last:
+                break
+
+            # If cache is disabled ..
+            if cache is None:
+                # .. extract text right away
+                yield self.tokenize(self.extract_text(page))
+
+                # .. and proceed with next page
+                continue
+
+            # Determine page hash
+            key = self.hash_page(page)
+
+            # If page is unknown ..
+            if key not in cache:
+                # .. extract & cache its text
+                cache[key] = self.tokenize(self.extract_text(page))
+
+            yield cache[key]
+
+
+    def tokenize(self, text: str) -> list:
+        """
+        Splits page text into stripped text lines
+        """
+
+        return [line.strip() for line in text.splitlines() if line]
+
+
+class PyPDF2Backend(Backend):
+    """
+    Extracts text using 'PyPDF2' (legacy API)
+    """
+
+    name = 'pypdf2'
+
+
+    def load_pages(self, pdf_file: BufferedReader) -> list:
+        # Import library
+        import PyPDF2
+
+        return PyPDF2.PdfFileReader(pdf_file).pages
+
+
+    def extract_text(self, page) -> str:
+        return page.extractText()
+
+
+    def load_content(self, page) -> bytes:
+        # Import library
+        from PyPDF2.generic import ArrayObject
+
+        # Fetch content stream(s) (if any)
+        content = page.getContents()
+
+        if content is None:
+            return b''
+
+        # Combine content streams (if split into several ones)
+        if isinstance(content, ArrayObject):
+            return b''.join([stream.getObject().getData() for stream in content])
+
+        return content.getData()
+
+
+class PypdfBackend(Backend):
+    """
+    Extracts text using 'pypdf' (successor of 'PyPDF2')
+    """
+
+    name = 'pypdf'
+
+
+    def load_pages(self, pdf_file: BufferedReader) -> list:
+        # Import library
+        import pypdf
+
+        return pypdf.PdfReader(pdf_file).pages
+
+
+    def extract_text(self, page) -> str:
+        return page.extract_text()
+
+
+    def load_content(self, page) -> bytes:
+        # Fetch content stream (if any)
+        content = page.get_contents()
+
+        return content.get_data() if content is not None else b''
+
+
+class PdfminerBackend(Backend):
+    """
+    Extracts text using 'pdfminer.six'
+    """
+
+    name = 'pdfminer'
+
+
+    def load_pages(self, pdf_file: BufferedReader) -> list:
+        # Import library
+        from pdfminer.pdfpage import PDFPage
+
+        return PDFPage.get_pages(pdf_file)
+
+
+    def extract_text(self, page) -> str:
+        # Import libraries
+        from pdfminer.converter import PDFPageAggregator
+        from pdfminer.layout import LAParams, LTTextContainer
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+
+        # Render page layout
+        manager = PDFResourceManager()
+        device = PDFPageAggregator(manager, laparams = LAParams())
+        PDFPageInterpreter(manager, device).process_page(page)
+
+        # Combine text of all text boxes
+        return ''.join([element.get_text() for element in device.get_result() if isinstance(element, LTTextContainer)])
+
+
+    def load_content(self, page) -> bytes:
+        # Import library
+        from pdfminer.pdftypes import resolve1
+
+        # Combine all content streams (if any)
+        return b''.join([resolve1(stream).get_data() for stream in page.contents])
+
+
+# Define available backends
+BACKENDS = {backend.name: backend for backend in [
+    PyPDF2Backend,
+    PypdfBackend,
+    PdfminerBackend,
+]}
+
+
+def get_backend(name: str = 'pypdf2') -> Backend:
+    """
+    Provides text extraction backend by name
+    """
+
+    # If backend is unknown ..
+    if name.lower() not in BACKENDS:
+        # .. throw exception
+        raise ValueError('Unknown backend "{}", use one of {}.'.format(name, ', '.join(BACKENDS)))
+
+    return BACKENDS[name.lower()]()
@@ -0,0 +1,196 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
+from pathlib import Path
+
+from .sta import Sitzungsdienst
+from .utils import dedupe, load_json
+
+
+def hash_file(pdf_file: str) -> str:
+    """
+    Hashes contents of given file
+    """
+
+    # Import library
+    from hashlib import sha256
+
+    # Create hash object
+    digest = sha256()
+
+    # Read file in chunks
+    with open(pdf_file, 'rb') as file:
+        for chunk in iter(lambda: file.read(65536), b''):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def dump_atomic(data, json_file: Path) -> None:
+    """
+    Stores data as given JSON file, replacing it
+    only after the new contents are fully written
+    """
+
+    # Import libraries
+    from json import dump
+    from os import fsync, replace
+
+    # Write data to temporary file next to it ..
+    temp_file = json_file.with_name(json_file.name + '.tmp')
+
+    with open(temp_file, 'w') as file:
+        dump(data, file, ensure_ascii = False)
+
+        # .. making sure it hits the disk
+        file.flush()
+        fsync(file.fileno())
+
+    # .. and swap files
+    replace(temp_file, json_file)
+
+
+def process_file(pdf_file: str, backend: str = 'pypdf2') -> tuple:
+    """
+    Processes given PDF file, returning its
+    hash & records (or error message)
+    """
+
+    # Attempt to ..
+    try:
+        with open(pdf_file, 'rb') as file:
+            # .. process data
+            sta = Sitzungsdienst(file, backend)
+
+            return (sta.digest(), sta.data, None)
+
+    # .. otherwise ..
+    except Exception as error:
+        # .. report error
+        return (None, [], '{}: {}'.format(type(error).__name__, error))
+
+
+class Backfill:
+    """
+    This class represents (resumable) processing of
+    many PDF files, checkpointing after each chunk
+    """
+
+    def __init__(self, state_dir: str = '.backfill', backend: str = 'pypdf2') -> None:
+        """
+        Loads manifest of already processed files from `state_dir`
+        """
+
+        self.state_dir = Path(state_dir)
+        self.results_dir = self.state_dir / 'results'
+        self.manifest_file = self.state_dir / 'manifest.json'
+
+        self.backend = backend
+
+        # Create state directory (if necessary)
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        # Create manifest, mapping paths to hash, backend & record count
+        self.manifest = {}
+
+        # If manifest exists ..
+        if self.manifest_file.exists():
+            # .. open it and ..
+            with open(self.manifest_file, 'r') as file:
+                # .. load its contents
+                self.manifest = load_json(file)
+
+
+    def result_file(self, digest: str, backend: str) -> Path:
+        """
+        Builds path of results for given file hash & backend
+        """
+
+        return self.results_dir / '{}-{}.json'.format(digest, backend)
+
+
+    def is_done(self, pdf_file: str) -> bool:
+        """
+        Checks whether given file was processed
+        (using current backend) & is unchanged
+        """
+
+        # Skip unknown files
+        if pdf_file not in self.manifest:
+            return False
+
+        entry = self.manifest[pdf_file]
+
+        # Skip files processed using other backends
+        if entry.get('backend') != self.backend:
+            return False
+
+        return self.result_file(entry['hash'], entry['backend']).exists() and hash_file(pdf_file) == entry['hash']
+
+
+    def run(self, pdf_files: list, jobs: int = None, chunk_size: int = 10, callback = None) -> list:
+        """
+        Processes remaining PDF files in parallel chunks,
+        returning errors per file (if any)
+        """
+
+        # Determine remaining files
+        remaining = [pdf_file for pdf_file in pdf_files if not self.is_done(pdf_file)]
+
+        # Create error buffer
+        errors = []
+
+        with ProcessPoolExecutor(max_workers = jobs) as executor:
+            for index in range(0, len(remaining), chunk_size):
+                chunk = remaining[index:index + chunk_size]
+
+                for pdf_file, (digest, data, error) in zip(chunk, executor.map(process_file, chunk, repeat(self.backend))):
+                    # If processing failed ..
+                    if error:
+                        # .. store error & retry next time
+                        errors.append((pdf_file, error))
+
+                        # .. dropping results of previous version (if any)
+                        self.manifest.pop(pdf_file, None)
+
+                        continue
+
+                    # Store records before they enter the manifest
+                    dump_atomic(data, self.result_file(digest, self.backend))
+
+                    self.manifest[pdf_file] = {
+                        'hash': digest,
+                        'backend': self.backend,
+                        'records': len(data),
+                    }
+
+                # Checkpoint after each chunk
+                dump_atomic(self.manifest, self.manifest_file)
+
+                # Report progress (if enabled)
+                if callback is not None:
+                    callback(min(index + chunk_size, len(remaining)), len(remaining))
+
+        return errors
+
+
+    def merge(self, pdf_files: list) -> list:
+        """
+        Combines records of all given (processed) files
+        """
+
+        # Create data array
+        data = []
+
+        for pdf_file in pdf_files:
+            # Skip unprocessed files (using current backend)
+            if self.manifest.get(pdf_file, {}).get('backend') != self.backend:
+                continue
+
+            entry = self.manifest[pdf_file]
+
+            with open(self.result_file(entry['hash'], entry['backend']), 'r') as file:
+                data += load_json(file)
+
+        # Remove duplicate entries
+        return sorted(dedupe(data), key=itemgetter('date', 'who', 'when', 'where', 'what'))
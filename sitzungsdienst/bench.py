@@ -0,0 +1,170 @@
+from pathlib import Path
+from time import perf_counter
+
+import click
+
+from .backends import BACKENDS, get_backend
+from .sta import Sitzungsdienst
+from .synthetic import dump_pdf, generate_pages
+from .utils import dedupe, load_json
+
+
+def benchmark_backend(name: str, pdf_files: list, fixtures: str = 'tests/fixtures', rounds: int = 3) -> dict:
+    """
+    Extracts data from each PDF file using given backend,
+    checking the results against their JSON fixtures
+    """
+
+    # Create report
+    report = {
+        'backend': name,
+        'pages': 0,
+        'seconds': 0.0,
+        'passed': [],
+        'failed': [],
+        'unchecked': [],
+    }
+
+    # Load backend
+    backend = get_backend(name)
+
+    for pdf_file in pdf_files:
+        # Determine slug & fixture
+        slug = Path(pdf_file).stem
+        fixture = Path(fixtures, slug, 'file_format.json')
+
+        for _ in range(rounds):
+            with open(pdf_file, 'rb') as file:
+                # Time text extraction only ..
+                start = perf_counter()
+                pages = list(backend.extract_pages(file))
+                report['seconds'] += perf_counter() - start
+
+            # .. but keep track of page count
+            report['pages'] += len(pages)
+
+        # Skip PDFs without fixture, but report them
+        if not fixture.exists():
+            report['unchecked'].append(slug)
+
+            continue
+
+        # Build records using backend
+        with open(pdf_file, 'rb') as file:
+            data = dedupe(Sitzungsdienst(file, name).data)
+
+        # Compare records against fixture
+        with open(fixture, 'r') as file:
+            report['passed' if data == load_json(file) else 'failed'].append(slug)
+
+    return report
+
+
+def benchmark_scaling(weeks: int, courts: int = 10, staff: int = 50, seed: int = 0) -> dict:
+    """
+    Processes synthetic document of given size,
+    timing each stage of the parser separately
+    """
+
+    # Generate synthetic document
+    pages = generate_pages(weeks, courts, staff, seed=seed)
+
+    # Create report
+    report = {
+        'weeks': weeks,
+        'pages': len(pages),
+    }
+
+    # Time each stage
+    start = perf_counter()
+    sta = Sitzungsdienst.from_pages(pages)
+    report['total'] = perf_counter() - start
+
+    start = perf_counter()
+    source = sta.process_pages(pages)
+    report['process_pages'] = perf_counter() - start
+
+    start = perf_counter()
+    sta.process_data(source)
+    report['process_data'] = perf_counter() - start
+
+    start = perf_counter()
+    sta.filter(['100', '200', '300'])
+    report['filter'] = perf_counter() - start
+
+    # Keep track of record count
+    report['records'] = len(sta.data)
+
+    return report
+
+
+@click.group()
+def bench() -> None:
+    """Run benchmarks."""
+
+
+@bench.command('backends')
+@click.argument('sources', nargs=-1, type=click.Path(exists=True))
+@click.option('-b', '--backend', 'names', multiple=True, help='Backend(s) to compare, defaults to all of them.')
+@click.option('-x', '--fixtures', default='tests/fixtures', type=click.Path(), help='Fixtures directory.')
+@click.option('-r', '--rounds', default=3, help='Extraction rounds per PDF file.')
+def compare(sources: tuple, names: tuple, fixtures: str, rounds: int) -> None:
+    """Compare text extraction backends on SOURCES (default: archive/*.pdf)."""
+
+    # Default to archived PDF files
+    pdf_files = sources or sorted(str(file) for file in Path('archive').glob('*.pdf'))
+
+    for name in names or BACKENDS:
+        # Attempt to ..
+        try:
+            # .. run benchmark
+            report = benchmark_backend(name, pdf_files, fixtures, rounds)
+
+        # .. otherwise ..
+        except ImportError as error:
+            # .. report missing library
+            click.echo('{}: unavailable ({})'.format(name, error))
+
+            # .. proceed with next backend
+            continue
+
+        # Calculate throughput
+        speed = report['pages'] / report['seconds'] if report['seconds'] else 0
+
+        click.echo('{}: {:.1f} pages/s, {} passed, {} failed{}, {} unchecked{}'.format(
+            name,
+            speed,
+            len(report['passed']),
+            len(report['failed']),
+            ' ({})'.format(', '.join(report['failed'])) if report['failed'] else '',
+            len(report['unchecked']),
+            # Flag results without any fixture being compared
+            ' (UNVERIFIED)' if not report['passed'] + report['failed'] else '',
+        ))
+
+
+@bench.command()
+@click.option('-w', '--weeks', multiple=True, type=int, help='Document size(s) in weeks, defaults to 1, 4, 13 & 52.')
+@click.option('-c', '--courts', default=10, help='Number of courts.')
+@click.option('-s', '--staff', default=50, help='Number of assignees.')
+@click.option('-o', '--pdf-output', type=click.Path(dir_okay=False), help='Store largest synthetic document as PDF file.')
+def scaling(weeks: tuple, courts: int, staff: int, pdf_output: str) -> None:
+    """Process synthetic documents of increasing size."""
+
+    # Determine document sizes
+    sizes = weeks or [1, 4, 13, 52]
+
+    for size in sizes:
+        # Run benchmark
+        report = benchmark_scaling(size, courts, staff)
+
+        click.echo('{weeks} weeks, {pages} pages, {records} records: {total:.3f}s total (process_pages {process_pages:.3f}s, process_data {process_data:.3f}s, filter {filter:.3f}s)'.format(**report))
+
+    # If enabled ..
+    if pdf_output:
+        # .. store synthetic document as PDF file
+        dump_pdf(generate_pages(max(sizes), courts, staff, seed=0), pdf_output)
+
+
+if __name__ == '__main__':
+    bench()
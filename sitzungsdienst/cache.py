@@ -0,0 +1,58 @@
+from pathlib import Path
+
+
+class PageCache(dict):
+    """
+    This class represents extracted page text, stored
+    as JSON file & keyed by hash of each page's content
+    """
+
+    def __init__(self, cache_file: str = 'pages.json') -> None:
+        """
+        Loads previously extracted page text from `cache_file`
+        """
+
+        super().__init__()
+
+        self.cache_file = Path(cache_file)
+
+        # If cache file exists ..
+        if self.cache_file.exists():
+            # Import library
+            from .utils import load_json
+
+            # .. open it and ..
+            with open(self.cache_file, 'r') as file:
+                # .. load its contents
+                self.update(load_json(file))
+
+        # Track changes
+        self.modified = False
+
+
+    def __setitem__(self, key: str, value: list) -> None:
+        super().__setitem__(key, value)
+
+        self.modified = True
+
+
+    def save(self) -> None:
+        """
+        Stores page text as JSON file (if modified)
+        """
+
+        # Skip unmodified cache
+        if not self.modified:
+            return
+
+        # Import library
+        from json import dump
+
+        # Create parent directory (if necessary)
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write data to JSON file
+        with open(self.cache_file, 'w') as file:
+            dump(self, file, ensure_ascii = False)
+
+        self.modified = False
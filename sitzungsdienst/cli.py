@@ -1,42 +1,197 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import BufferedReader
+from os import fstat
 from pathlib import Path
+from time import perf_counter
 
 import click
 
+from .backends import BACKENDS
+from .backfill import Backfill
+from .cache import PageCache
+from .diff import diff_records, dump_diff
+from .intervals import IntervalIndex
+from .metrics import RunMetrics, append_metrics, find_regressions, find_trend, load_metrics, run_group, speed
 from .sta import Sitzungsdienst
-from .utils import dedupe, dump_csv, dump_ics, dump_json, load_json
+from .utils import dedupe, dump_data, load_json
 
 
-@click.command()
+class DefaultGroup(click.Group):
+    """
+    This class represents a group of commands, invoking
+    the default command unless a subcommand is given
+    """
+
+    def __init__(self, *args, default: str = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        # Store default command
+        self.default = default
+
+
+    def parse_args(self, ctx: click.Context, args: list) -> list:
+        # If first argument is neither subcommand nor help / version ..
+        if not args or args[0] not in list(self.commands) + ['--help', '--version']:
+            # .. invoke default command
+            args.insert(0, self.default)
+
+        return super().parse_args(ctx, args)
+
+
+def file_size(file: BufferedReader) -> int:
+    """
+    Determines size of given file object (if possible)
+    """
+
+    # Attempt to ..
+    try:
+        # .. determine file size
+        return fstat(file.fileno()).st_size
+
+    # .. otherwise ..
+    except (AttributeError, OSError):
+        # .. give up
+        return None
+
+
+def parse_page_range(ctx: click.Context, param: click.Parameter, value: str) -> tuple:
+    """
+    Converts page range (eg '2-3', '2-' or '2') to tuple
+    """
+
+    # Skip empty values
+    if value is None:
+        return None
+
+    # Split first & last page
+    first, separator, last = value.partition('-')
+
+    # Attempt to ..
+    try:
+        # .. convert single page
+        if not separator:
+            first = last = int(first)
+
+        # .. convert page range
+        else:
+            first, last = int(first), int(last) if last else None
+
+    # .. otherwise ..
+    except ValueError:
+        # .. report invalid value
+        raise click.BadParameter('Use "FIRST-LAST", "FIRST-" or "PAGE".')
+
+    # Enforce pages starting at one, in ascending order
+    if first < 1 or (last is not None and last < first):
+        raise click.BadParameter('Pages start at 1, with LAST not preceding FIRST.')
+
+    return (first, last)
+
+
+def parse_dates(ctx: click.Context, param: click.Parameter, value: tuple) -> tuple:
+    """
+    Validates dates (YYYY-MM-DD)
+    """
+
+    # Import library
+    from datetime import datetime
+
+    for item in value:
+        # Attempt to ..
+        try:
+            # .. convert date
+            datetime.strptime(item, '%Y-%m-%d')
+
+        # .. otherwise ..
+        except ValueError:
+            # .. report invalid value
+            raise click.BadParameter('Use "YYYY-MM-DD", not "{}".'.format(item))
+
+    return value
+
+
+def parse_date_time(ctx: click.Context, param: click.Parameter, value: tuple) -> tuple:
+    """
+    Validates date (YYYY-MM-DD) & time (HH:MM)
+    """
+
+    # Skip empty values
+    if not value:
+        return None
+
+    # Import library
+    from datetime import datetime
+
+    # Attempt to ..
+    try:
+        # .. convert date & time
+        moment = datetime.strptime(' '.join(value), '%Y-%m-%d %H:%M')
+
+    # .. otherwise ..
+    except ValueError:
+        # .. report invalid value
+        raise click.BadParameter('Use "YYYY-MM-DD HH:MM".')
+
+    return (moment.strftime('%Y-%m-%d'), moment.strftime('%H:%M'))
+
+
+@click.group(cls=DefaultGroup, default='extract')
+@click.version_option('1.5.2')
+def cli() -> None:
+    """Process weekly assignments, extracting them by default."""
+
+
+@cli.command()
 @click.argument('source', type=click.File('rb'))
 @click.option('-o', '--output', default='data', type=click.Path(), help='Output filename, without extension.')
 @click.option('-d', '--directory', default='dist', help='Output directory.')
-@click.option('-f', '--file-format', default='csv', help='File format, "csv", "json" or "ics".')
+@click.option('-f', '--file-format', default='csv', help='File format, "csv", "json", "ndjson" or "ics".')
 @click.option('-q', '--query', multiple=True, help='Query assignees, eg for name, department.')
 @click.option('-i', '--inquiries', type=click.File('rb'), help='JSON file with parameters for automation.')
+@click.option('-b', '--backend', default='pypdf2', type=click.Choice(list(BACKENDS), case_sensitive=False), help='PDF text extraction backend.')
+@click.option('-p', '--page-cache', type=click.Path(dir_okay=False), help='JSON file caching extracted text per page.')
+@click.option('-z', '--compress', is_flag=True, help='Compress NDJSON output using gzip.')
+@click.option('--fast-json', is_flag=True, help='Encode NDJSON output using "orjson" (if installed).')
+@click.option('-w', '--weekday', multiple=True, type=click.Choice(['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']), help='Parse given weekday(s) only.')
+@click.option('-t', '--date', multiple=True, callback=parse_dates, help='Parse given date(s) only, eg "2022-01-10".')
+@click.option('--pages', callback=parse_page_range, help='Parse given page range only, eg "2-3".')
+@click.option('-j', '--jobs', default=1, help='Number of files being written in parallel.')
+@click.option('--pool', default='auto', type=click.Choice(['auto', 'thread', 'process']), help='Worker pool for parallel writing, "auto" uses processes for "ics" only.')
 @click.option('-c', '--clear-cache', is_flag=True, help='Remove existing files in directory first.')
+@click.option('-m', '--metrics-file', default='metrics.jsonl', type=click.Path(dir_okay=False), help='JSON Lines file storing run metrics.')
+@click.option('--no-metrics', is_flag=True, help='Disable storing run metrics.')
 @click.option('-v', '--verbose', count=True, help='Enable verbose mode.')
 @click.version_option('1.5.2')
-def cli(source: BufferedReader, output: str, directory: str, file_format: str, query: str, inquiries: BufferedReader, clear_cache: bool, verbose: int) -> None:
+def extract(source: BufferedReader, output: str, directory: str, file_format: str, query: str, inquiries: BufferedReader, backend: str, page_cache: str, compress: bool, fast_json: bool, weekday: tuple, date: tuple, pages: tuple, jobs: int, pool: str, clear_cache: bool, metrics_file: str, no_metrics: bool, verbose: int) -> None:
     """Extract weekly assignments from SOURCE file."""
 
+    # Start measuring run metrics
+    metrics = RunMetrics(source = source.name, size = file_size(source), backend = backend, cached = bool(page_cache), file_format = file_format)
+
     # If file format is invalid ..
-    if file_format.lower() not in ['csv', 'json', 'ics']:
+    if file_format.lower() not in ['csv', 'json', 'ndjson', 'ics']:
         # (1) .. report falling back
         if verbose > 0: click.echo('Invalid file format "{}", falling back to "csv".'.format(file_format))
 
         # (2) .. actually fall back
         file_format = 'csv'
 
-    # Process data
-    sta = Sitzungsdienst(source)
+    # Process data, reusing text of unchanged pages (if enabled)
+    sta = Sitzungsdienst(source, backend, PageCache(page_cache) if page_cache else None, list(weekday) or None, list(date) or None, pages)
+
+    # Parse file (deferred until now)
+    with metrics.stage('parse'):
+        data = sta.data
 
     # If results are empty ..
-    if not sta.data:
+    if not data:
         # (1) .. report back
         if verbose > 0: click.echo('No results found!')
 
-        # (2) .. abort further execution
+        # (2) .. store run metrics (if enabled)
+        if not no_metrics: append_metrics(metrics.finish(pages = sta.extracted, records = 0, written = 0, skipped = 0, failed = 0), metrics_file)
+
+        # (3) .. abort further execution
         click.Context.abort('')
 
     # Build default request
@@ -55,11 +210,14 @@ def cli(source: BufferedReader, output: str, directory: str, file_format: str, q
 
     # If enabled ..
     if clear_cache:
-        # .. loop over CSV, JSON & ICS files ..
-        for path in [file.resolve() for file in Path(directory).glob('**/*') if file.suffix in ['.csv', '.json', '.ics']]:
+        # .. loop over CSV, JSON, NDJSON & ICS files ..
+        for path in [file.resolve() for file in Path(directory).glob('**/*') if file.suffix in ['.csv', '.json', '.ndjson', '.ics'] or file.name.endswith('.ndjson.gz')]:
             # .. deleting each on of them
             path.unlink()
 
+    # Create task buffer, mapping output files to their data
+    tasks = {}
+
     # Iterate over requests
     for request in requests:
         # Get data
@@ -81,7 +239,8 @@ def cli(source: BufferedReader, output: str, directory: str, file_format: str, q
                 click.echo('Querying data for {} ..'.format(' '.join(query_report)), nl=False)
 
             # Filter data
-            data = sta.filter(request['query'])
+            with metrics.stage('filter'):
+                data = sta.filter(request['query'])
 
             # If results are empty ..
             if not data:
@@ -97,24 +256,60 @@ def cli(source: BufferedReader, output: str, directory: str, file_format: str, q
         # Build output path
         output_file = Path(directory, '{}.{}'.format(request['output'].lower(), file_format))
 
+        # If enabled, append extension for gzip-compressed NDJSON
+        if file_format == 'ndjson' and compress:
+            output_file = output_file.with_suffix('.ndjson.gz')
+
+        # Remove duplicate entries & queue file for writing,
+        # letting the last request win if output files collide
+        tasks.pop(output_file, None)
+        tasks[output_file] = dedupe(data)
+
+    # Create error buffer
+    errors = []
+
+    # Start measuring write stage
+    write_start = perf_counter()
+
+    # Create buffer for pending files
+    executor = None
+    futures = {}
+
+    # If parallel writing is enabled ..
+    if jobs > 1:
+        # .. determine worker pool, using processes for CPU-heavy ICS generation
+        if pool == 'auto':
+            pool = 'process' if file_format == 'ics' else 'thread'
+
+        # .. dispatch writing files to it
+        executor = (ProcessPoolExecutor if pool == 'process' else ThreadPoolExecutor)(max_workers = jobs)
+        futures = {output_file: executor.submit(dump_data, data, output_file, file_format, compress, fast_json) for output_file, data in tasks.items()}
+
+    # Write files (or wait for them), reporting back in order
+    for output_file, data in tasks.items():
         # Report saving the file
         if verbose > 0: click.echo('Saving file as "{}" ..'.format(output_file), nl=False)
 
-        # Remove duplicate entries
-        data = dedupe(data)
+        # Attempt to ..
+        try:
+            # .. write file right away (if writing serially) ..
+            if output_file not in futures:
+                dump_data(data, output_file, file_format, compress, fast_json)
+
+            # .. or wait for file being written
+            else:
+                futures[output_file].result()
 
-        # Write data as ..
-        if file_format == 'csv':
-            # (1) .. CSV
-            dump_csv(data, output_file)
+        # .. otherwise ..
+        except Exception as error:
+            # (1) .. report failure
+            if verbose > 0: click.echo(' failed!')
 
-        if file_format == 'json':
-            # (2) .. JSON
-            dump_json(data, output_file)
+            # (2) .. store error
+            errors.append((output_file, error))
 
-        if file_format == 'ics':
-            # (3) .. ICS
-            dump_ics(data, output_file)
+            # (3) .. proceed with next file
+            continue
 
         # Report back
         if verbose > 0: click.echo(' done.')
@@ -144,3 +339,232 @@ def cli(source: BufferedReader, output: str, directory: str, file_format: str, q
 
                 # Add delimiter before each subsequent entry
                 click.echo('--')
+
+    # If worker pool was used ..
+    if executor is not None:
+        # .. release it
+        executor.shutdown()
+
+    # Store run metrics (if enabled)
+    if not no_metrics:
+        # Add write stage
+        metrics.record['stages']['write'] = perf_counter() - write_start
+
+        append_metrics(metrics.finish(
+            pages = sta.extracted,
+            records = len(sta.data),
+            written = len(tasks) - len(errors),
+            skipped = len(requests) - len(tasks),
+            failed = len(errors),
+        ), metrics_file)
+
+    # If any file could not be written ..
+    if errors:
+        # (1) .. report all of them
+        for output_file, error in errors:
+            click.echo('Writing "{}" failed: {}'.format(output_file, error), err=True)
+
+        # (2) .. abort further execution
+        click.Context.abort('')
+
+
+@cli.command()
+@click.argument('sources', nargs=-1, required=True, type=click.File('rb'))
+@click.option('-l', '--duration', default=1, help='Duration of each session, in hours.')
+@click.option('-f', '--free', nargs=2, metavar='DATE TIME', callback=parse_date_time, help='List assignees available at DATE (YYYY-MM-DD) & TIME (HH:MM) instead.')
+@click.option('-b', '--backend', default='pypdf2', type=click.Choice(list(BACKENDS), case_sensitive=False), help='PDF text extraction backend.')
+def check(sources: tuple, duration: int, free: tuple, backend: str) -> None:
+    """Check assignments from SOURCES for conflicts."""
+
+    # Create data buffer
+    data = []
+
+    # Process data of all files
+    for source in sources:
+        data += Sitzungsdienst(source, backend).data
+
+    # Index sessions per assignee
+    index = IntervalIndex(dedupe(data), duration)
+
+    # If date & time are given ..
+    if free:
+        # .. list available assignees
+        for person in index.free(*free):
+            click.echo(person)
+
+        # .. and skip conflicts
+        return
+
+    # Find conflicting sessions
+    conflicts = index.conflicts()
+
+    for conflict in conflicts:
+        click.echo('{} ({}): {} {} ({}) & {} {} ({})'.format(
+            conflict['who'],
+            conflict['date'],
+            conflict['first']['when'],
+            conflict['first']['where'],
+            conflict['first']['what'],
+            conflict['second']['when'],
+            conflict['second']['where'],
+            conflict['second']['what'],
+        ))
+
+    # If there are none ..
+    if not conflicts:
+        # .. report back
+        click.echo('No conflicts found!')
+
+
+@cli.command()
+@click.option('-m', '--metrics-file', default='metrics.jsonl', type=click.Path(dir_okay=False), help='JSON Lines file storing run metrics.')
+@click.option('-n', '--limit', default=20, help='Number of runs being shown.')
+@click.option('-w', '--window', default=10, help='Number of previous runs forming the baseline.')
+@click.option('-t', '--threshold', default=1.5, help='Factor by which runs may be slower than the baseline.')
+def metrics(metrics_file: str, limit: int, window: int, threshold: float) -> None:
+    """Show run metrics & flag slow runs."""
+
+    # Load metrics history
+    history = load_metrics(metrics_file)
+
+    # If history is empty ..
+    if not history:
+        # (1) .. report back
+        click.echo('No metrics found!')
+
+        # (2) .. abort further execution
+        return
+
+    # Find slow runs
+    regressions = {id(item['record']): item for item in find_regressions(history, window, threshold)}
+
+    for record in history[-limit:]:
+        # Determine throughput
+        throughput = speed(record)
+
+        click.echo('{} {}: {} pages, {} records in {:.2f}s ({:.1f} pages/s parsed; {}), {} written, {} skipped, {} failed, {} KiB peak RSS'.format(
+            record['timestamp'],
+            record.get('source'),
+            record.get('pages'),
+            record.get('records'),
+            record['duration'],
+            throughput or 0,
+            ', '.join(['{} {:.2f}s'.format(stage, duration) for stage, duration in record['stages'].items()]),
+            record.get('written'),
+            record.get('skipped'),
+            record.get('failed'),
+            record.get('peak_rss'),
+        ))
+
+        # If run is slow ..
+        if id(record) in regressions:
+            # .. flag it
+            click.echo('  SLOW: {:.1f}x baseline'.format(regressions[id(record)]['factor']))
+
+    # Determine trend, comparing recent runs to previous ones
+    trend = find_trend(history, window)
+
+    if trend is not None:
+        # Determine comparable runs
+        backend, cached = run_group([record for record in history if speed(record)][-1])
+
+        click.echo('Trend: {:+.1f}% pages/s parsed over the last {} runs ({}, {})'.format(100 * trend, window, backend, 'cached' if cached else 'uncached'))
+
+
+@cli.command()
+@click.argument('archives', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('-o', '--output', default='backfill', type=click.Path(), help='Output filename, without extension.')
+@click.option('-d', '--directory', default='dist', help='Output directory.')
+@click.option('-f', '--file-format', default='csv', type=click.Choice(['csv', 'json', 'ndjson', 'ics']), help='File format.')
+@click.option('-s', '--state-dir', default='.backfill', type=click.Path(file_okay=False), help='Directory storing manifest & results per file.')
+@click.option('-b', '--backend', default='pypdf2', type=click.Choice(list(BACKENDS), case_sensitive=False), help='PDF text extraction backend.')
+@click.option('-j', '--jobs', type=int, help='Number of files being processed in parallel, defaults to number of CPUs.')
+@click.option('-n', '--chunk-size', default=10, help='Number of files being processed between checkpoints.')
+@click.option('-v', '--verbose', count=True, help='Enable verbose mode.')
+def backfill(archives: tuple, output: str, directory: str, file_format: str, state_dir: str, backend: str, jobs: int, chunk_size: int, verbose: int) -> None:
+    """Process (& resume processing) all PDF files in ARCHIVES."""
+
+    # Collect PDF files, expanding directories
+    pdf_files = []
+
+    for archive in archives:
+        if Path(archive).is_dir():
+            pdf_files += sorted(str(file.resolve()) for file in Path(archive).glob('**/*.pdf'))
+
+        else:
+            pdf_files.append(str(Path(archive).resolve()))
+
+    # Load manifest of processed files
+    job = Backfill(state_dir, backend)
+
+    # Define progress report
+    def report(done: int, total: int) -> None:
+        if verbose > 0: click.echo('Processed {} of {} remaining files.'.format(done, total))
+
+    # Process remaining files
+    errors = job.run(pdf_files, jobs, chunk_size, report)
+
+    # Merge results of all files
+    data = job.merge(pdf_files)
+
+    # Create output path (if necessary)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+    # Build output path
+    output_file = Path(directory, '{}.{}'.format(output.lower(), file_format))
+
+    # Report saving the file
+    if verbose > 0: click.echo('Saving {} records as "{}" ..'.format(len(data), output_file), nl=False)
+
+    dump_data(data, output_file, file_format)
+
+    # Report back
+    if verbose > 0: click.echo(' done.')
+
+    # If any file could not be processed ..
+    if errors:
+        # (1) .. report all of them
+        for pdf_file, error in errors:
+            click.echo('Processing "{}" failed: {}'.format(pdf_file, error), err=True)
+
+        # (2) .. abort further execution
+        click.Context.abort('')
+
+
+@cli.command()
+@click.argument('old', type=click.File('rb'))
+@click.argument('new', type=click.File('rb'))
+@click.option('-o', '--output', default='diff', type=click.Path(), help='Output filename, without extension.')
+@click.option('-d', '--directory', default='dist', help='Output directory.')
+@click.option('-f', '--file-format', default='csv', type=click.Choice(['csv', 'json', 'ndjson', 'ics']), help='File format, "ics" cancels removed & reassigned sessions.')
+@click.option('-b', '--backend', default='pypdf2', type=click.Choice(list(BACKENDS), case_sensitive=False), help='PDF text extraction backend.')
+@click.option('-v', '--verbose', count=True, help='Enable verbose mode.')
+def diff(old: BufferedReader, new: BufferedReader, output: str, directory: str, file_format: str, backend: str, verbose: int) -> None:
+    """Compare assignments from OLD & NEW file, storing changes only."""
+
+    # Determine changes
+    changes = diff_records(dedupe(Sitzungsdienst(old, backend).data), dedupe(Sitzungsdienst(new, backend).data))
+
+    # If there are none ..
+    if not changes:
+        # .. report back, but still store (empty) file
+        if verbose > 0: click.echo('No changes found!')
+
+    # Report changes
+    elif verbose > 0:
+        for change in ['added', 'removed', 'reassigned']:
+            click.echo('{}: {}'.format(change.capitalize(), len([item for item in changes if item['change'] == change])))
+
+    # Create output path (if necessary)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+
+    # Build output path
+    output_file = Path(directory, '{}.{}'.format(output.lower(), file_format))
+
+    # Report saving the file
+    if verbose > 0: click.echo('Saving file as "{}" ..'.format(output_file), nl=False)
+
+    dump_diff(changes, output_file, file_format)
+
+    # Report back
+    if verbose > 0: click.echo(' done.')
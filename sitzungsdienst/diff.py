@@ -0,0 +1,140 @@
+from itertools import zip_longest
+
+from .utils import data2calendar, dump_csv, dump_data
+
+
+# Define fields of changes
+FIELDS = ['change', 'date', 'when', 'who', 'where', 'what', 'previous']
+
+
+def record_key(item: dict) -> tuple:
+    """
+    Builds stable key of given data record
+    """
+
+    return (item['date'], item['when'], item['where'], item['what'])
+
+
+def group_records(data: list) -> dict:
+    """
+    Maps stable keys to assignees of their individual records
+    """
+
+    # Create data array
+    groups = {}
+
+    for item in data:
+        groups.setdefault(record_key(item), set()).add(item['who'])
+
+    return groups
+
+
+def diff_records(old: list, new: list) -> list:
+    """
+    Compares two versions of data records, returning
+    added, removed & reassigned sessions only
+    (one change per individual record)
+    """
+
+    # Map stable keys to assignees
+    old_groups = group_records(old)
+    new_groups = group_records(new)
+
+    # Create data array
+    changes = []
+
+    for key in sorted(old_groups.keys() | new_groups.keys()):
+        # Determine previous & current assignees
+        previous = old_groups.get(key, set())
+        current = new_groups.get(key, set())
+
+        # Skip unchanged sessions
+        if previous == current:
+            continue
+
+        # Determine change, session being either ..
+        # (1) .. added
+        if not previous:
+            change = 'added'
+
+        # (2) .. removed
+        elif not current:
+            change = 'removed'
+
+        # (3) .. reassigned
+        else:
+            change = 'reassigned'
+
+        # Pair up assignees being replaced, one record each
+        for who, before in zip_longest(sorted(current - previous), sorted(previous - current), fillvalue=''):
+            changes.append({
+                'change': change,
+                'date': key[0],
+                'when': key[1],
+                'who': who,
+                'where': key[2],
+                'what': key[3],
+                'previous': before,
+            })
+
+    return changes
+
+
+def diff2calendar(changes: list, duration: int = 1):
+    """
+    Converts changes to iCalendar text, cancelling removed
+    & previously assigned sessions and adding new ones
+    """
+
+    # Create buffers for sessions being cancelled & added
+    cancelled = []
+    confirmed = []
+
+    for change in changes:
+        # Rebuild (individual) data records, since their event UIDs depend on them
+        if change['previous']:
+            cancelled.append({
+                'date': change['date'],
+                'when': change['when'],
+                'who': change['previous'],
+                'where': change['where'],
+                'what': change['what'],
+            })
+
+        if change['who']:
+            confirmed.append({
+                'date': change['date'],
+                'when': change['when'],
+                'who': change['who'],
+                'where': change['where'],
+                'what': change['what'],
+            })
+
+    # Combine cancellations & updates
+    calendar = data2calendar(cancelled, duration, 'CANCELLED')
+    calendar.events |= data2calendar(confirmed, duration, 'CONFIRMED').events
+
+    return calendar
+
+
+def dump_diff(changes: list, output_file: str, file_format: str = 'csv') -> None:
+    """
+    Stores changes as given file, using `file_format`
+    """
+
+    # If file format is ICS ..
+    if file_format == 'ics':
+        # .. write calendar object to ICS file
+        with open(output_file, 'w') as file:
+            file.writelines(diff2calendar(changes))
+
+        return
+
+    # If file format is CSV ..
+    if file_format == 'csv':
+        # .. keep header (even without any changes)
+        dump_csv(changes, output_file, FIELDS)
+
+        return
+
+    dump_data(changes, output_file, file_format)
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from re import match, sub
+
+
+class IntervalIndex:
+    """
+    This class represents sessions per assignee & date
+    as sorted time intervals, for detecting conflicts
+    & looking up who is available at a given time
+    """
+
+    def __init__(self, data: list, duration: int = 1) -> None:
+        """
+        Indexes given data records, assuming each
+        session takes `duration` hours
+        """
+
+        # Store duration (in minutes)
+        self.duration = duration * 60
+
+        # Create index, mapping assignees to dates to intervals
+        self.index = {}
+
+        # Create buffer for human-readable names
+        self.names = {}
+
+        for item in data:
+            # Skip entries without (valid) time
+            if not match(r'\d{2}:\d{2}$', item['when']):
+                continue
+
+            # Determine interval
+            start = self.to_minutes(item['when'])
+
+            # Add interval for each assignee
+            for person in item['who'].split(';'):
+                # Skip empty entries
+                if not person.strip():
+                    continue
+
+                # Normalize assignee, keeping first spelling for display
+                key = self.normalize(person)
+                self.names.setdefault(key, sub(r'\s+', ' ', person).strip())
+
+                self.index.setdefault(key, {}).setdefault(item['date'], []).append((start, start + self.duration, item))
+
+        # Create buffer for start times
+        self.starts = {}
+
+        # Sort intervals by start time
+        for key, dates in self.index.items():
+            for date, intervals in dates.items():
+                intervals.sort(key=lambda interval: interval[:2])
+
+                self.starts[(key, date)] = [interval[0] for interval in intervals]
+
+
+    def normalize(self, person: str) -> str:
+        """
+        Normalizes assignee for lookups
+        """
+
+        return sub(r'\s+', ' ', person).strip().casefold()
+
+
+    def to_minutes(self, time: str) -> int:
+        """
+        Converts time (HH:MM) to minutes since midnight
+        """
+
+        hours, minutes = time.split(':')
+
+        return int(hours) * 60 + int(minutes)
+
+
+    def conflicts(self) -> list:
+        """
+        Finds overlapping sessions per assignee
+        which take place at different locations
+        """
+
+        # Create data array
+        conflicts = []
+
+        for key, dates in sorted(self.index.items()):
+            for date, intervals in sorted(dates.items()):
+                # Create buffer for ongoing sessions
+                active = []
+
+                for start, end, item in intervals:
+                    # Drop sessions which ended before current one
+                    active = [interval for interval in active if interval[1] > start]
+
+                    for interval in active:
+                        # Skip sessions at the same location
+                        if interval[2]['where'] == item['where']:
+                            continue
+
+                        conflicts.append({
+                            'who': self.names[key],
+                            'date': date,
+                            'first': interval[2],
+                            'second': item,
+                        })
+
+                    active.append((start, end, item))
+
+        return conflicts
+
+
+    def free(self, date: str, time: str) -> list:
+        """
+        Finds assignees without any session overlapping
+        the session starting at `time` on given date
+        """
+
+        # Determine interval
+        start = self.to_minutes(time)
+        end = start + self.duration
+
+        # Create data array
+        available = []
+
+        for key in self.index:
+            # Since all sessions take equally long, the last session
+            # starting before the end of the interval ends last
+            starts = self.starts.get((key, date), [])
+            index = bisect_left(starts, end) - 1
+
+            # If there is none or it ends before the interval ..
+            if index < 0 or self.index[key][date][index][1] <= start:
+                # .. assignee is available
+                available.append(self.names[key])
+
+        return sorted(available)
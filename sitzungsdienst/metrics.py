@@ -0,0 +1,204 @@
+from contextlib import contextmanager
+from datetime import datetime
+from time import perf_counter
+
+
+class RunMetrics:
+    """
+    This class represents metrics of a single run,
+    eg input size, record count & stage durations
+    """
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Starts measuring, storing given values
+        """
+
+        # Start clock
+        self.start = perf_counter()
+
+        # Create metrics record
+        self.record = {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'stages': {},
+        }
+
+        self.record.update(kwargs)
+
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measures duration of a stage (adding up repeated ones)
+        """
+
+        start = perf_counter()
+
+        try:
+            yield
+
+        finally:
+            self.record['stages'][name] = self.record['stages'].get(name, 0) + perf_counter() - start
+
+
+    def finish(self, **kwargs) -> dict:
+        """
+        Stops measuring, returning metrics record
+        """
+
+        self.record.update(kwargs)
+
+        # Add total duration & peak memory usage
+        self.record['duration'] = perf_counter() - self.start
+        self.record['peak_rss'] = peak_rss()
+
+        return self.record
+
+
+def peak_rss() -> int:
+    """
+    Determines peak resident set size (in KiB) of
+    current process or any of its finished workers
+    """
+
+    # Attempt to ..
+    try:
+        # .. import library (not available on Windows)
+        import resource
+        import sys
+
+    # .. otherwise ..
+    except ImportError:
+        # .. give up
+        return None
+
+    # Include worker processes, eg of process pools
+    rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+    # macOS reports bytes, Linux reports KiB
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def append_metrics(record: dict, metrics_file: str) -> None:
+    """
+    Appends metrics record to given JSON Lines file
+    """
+
+    # Import library
+    from json import dumps
+
+    with open(metrics_file, 'a', encoding='utf-8') as file:
+        file.write(dumps(record, ensure_ascii = False, separators = (',', ':')) + '\n')
+
+
+def load_metrics(metrics_file: str) -> list:
+    """
+    Loads metrics records from given JSON Lines file
+    """
+
+    # Import libraries
+    from json import loads
+    from os.path import exists
+
+    # If metrics file does not exist ..
+    if not exists(metrics_file):
+        # .. there is no history
+        return []
+
+    with open(metrics_file, 'r', encoding='utf-8') as file:
+        return [loads(line) for line in file if line.strip()]
+
+
+def speed(record: dict) -> float:
+    """
+    Calculates parsing throughput (in pages per second)
+    """
+
+    # Determine parsing duration
+    duration = record.get('stages', {}).get('parse')
+
+    # Skip records without pages or duration
+    if not record.get('pages') or not duration:
+        return None
+
+    return record['pages'] / duration
+
+
+def run_group(record: dict) -> tuple:
+    """
+    Determines which runs are comparable, namely those
+    using the same backend (with or without page cache)
+    """
+
+    return (record.get('backend'), record.get('cached'))
+
+
+def find_regressions(history: list, window: int = 10, threshold: float = 1.5) -> list:
+    """
+    Compares each run's parsing time per page to the median
+    of `window` previous runs using the same backend (with
+    or without page cache), flagging those being slower
+    than `threshold` times this baseline
+    """
+
+    # Import library
+    from statistics import median
+
+    # Create data array
+    regressions = []
+
+    # Create buffer for previous runs (in seconds per page) per backend
+    previous = {}
+
+    for record in history:
+        # Skip runs without pages or duration
+        if not speed(record):
+            continue
+
+        current = 1 / speed(record)
+
+        # Compare runs of same backend only
+        runs = previous.setdefault(run_group(record), [])
+
+        # If there are enough previous runs ..
+        if len(runs) >= min(window, 3):
+            # .. determine baseline
+            baseline = median(runs[-window:])
+
+            # .. flag run if slower than that
+            if baseline and current > threshold * baseline:
+                regressions.append({
+                    'record': record,
+                    'baseline': baseline,
+                    'factor': current / baseline,
+                })
+
+        runs.append(current)
+
+    return regressions
+
+
+def find_trend(history: list, window: int = 10) -> float:
+    """
+    Compares parsing throughput of the last `window` runs to the
+    `window` runs before, using runs comparable to the last one
+    """
+
+    # Determine comparable runs with throughput
+    runs = [record for record in history if speed(record)]
+
+    # Skip empty history
+    if not runs:
+        return None
+
+    speeds = [speed(record) for record in runs if run_group(record) == run_group(runs[-1])]
+
+    # If there are too few runs ..
+    if len(speeds) < 2 * window:
+        # .. there is no trend
+        return None
+
+    recent = sum(speeds[-window:]) / window
+    previous = sum(speeds[-2 * window:-window]) / window
+
+    return recent / previous - 1
@@ -1,7 +1,11 @@
+from datetime import datetime, timedelta
 from io import BufferedReader
 from re import match, search
 from operator import itemgetter
 
+from .backends import get_backend
+from .cache import PageCache
+
 
 class Sitzungsdienst:
     """
@@ -9,25 +13,88 @@ class Sitzungsdienst:
     PDF file as published by the Staatsanwaltschaft Freiburg
     """
 
-    def __init__(self, input_file: BufferedReader) -> None:
+    def __init__(self, input_file: BufferedReader, backend: str = 'pypdf2', cache: PageCache = None, weekdays: list = None, dates: list = None, page_range: tuple = None) -> None:
+        """
+        Stores the given file object, deferring parsing
+        until the `data` property is first accessed
+
+        Parsing may be restricted to `weekdays` (eg 'Montag'),
+        `dates` (YYYY-MM-DD) & `page_range` (first & last page)
+        """
+
+        # Store file object
+        self.input_file = input_file
+
+        # Determine text extraction backend
+        self.backend = get_backend(backend)
+
+        # Store page cache (if any)
+        self.cache = cache
+
+        # Store parsing restrictions (if any)
+        self.weekdays = weekdays
+        self.dates = dates
+        self.page_range = page_range
+
+        # Initialize data buffer
+        self._data = None
+
+        # Initialize number of extracted pages
+        self.extracted = 0
+
+
+    @property
+    def data(self) -> list:
+        """
+        Parses & processes the stored file object
+        (once), providing the resulting records
+        """
+
+        # If file has not been parsed yet ..
+        if self._data is None:
+            # .. do so now
+            self._data = self.extract_data(self.input_file)
+
+        return self._data
+
+
+    @data.setter
+    def data(self, data: list) -> None:
+        self._data = data
+
+
+    @classmethod
+    def from_pages(cls, pages: list, backend: str = 'pypdf2') -> 'Sitzungsdienst':
         """
-        Parses & processes the given file object,
-        storing the result as the `data` property
+        Processes already extracted PDF content per-page,
+        eg from page cache or synthetic test documents
         """
 
-        self.data = self.extract_data(input_file)
+        # Create instance without file
+        sta = cls(None, backend)
+
+        sta.data = sta.process_records(pages)
+
+        return sta
 
 
-    def process_pages(self, pages: list) -> dict:
+    def process_pages(self, pages: list, weekdays: list = None, dates: list = None) -> dict:
         """
         Processes PDF content per-page,
         returning its contents per-date
+
+        If `weekdays` or `dates` (YYYY-MM-DD) are given, other dates
+        are skipped & processing stops once all dates are covered
         """
 
+        # Convert dates to their format in PDF files
+        if dates is not None:
+            dates = [self.reverse_date(item, '.', '-') for item in dates]
+
         # Create data array
         data = {}
 
-        # Initialize weekday buffer
+        # Initialize current date
         date = None
 
         # Extract data
@@ -58,6 +125,14 @@ class Sitzungsdienst:
                 if text in ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']:
                     date = page[index + 1]
 
+                    # Skip dates not being requested ..
+                    if not self.is_selected(date, weekdays, dates, text):
+                        # .. stopping once all requested dates are covered
+                        if dates is not None and all(item in data for item in dates):
+                            return data
+
+                        continue
+
                     if date not in data:
                         data[date] = []
 
@@ -73,6 +148,10 @@ class Sitzungsdienst:
                 if text in ['F', '+']:
                     continue
 
+                # (3) .. skipped (or unknown) date
+                if date not in data:
+                    continue
+
                 data[date].append(text)
 
         return data
@@ -203,12 +282,30 @@ class Sitzungsdienst:
         return False
 
 
-    def reverse_date(self, string: str, separator: str='-') -> str:
+    def is_selected(self, date: str, weekdays: list = None, dates: list = None, weekday: str = None) -> bool:
+        """
+        Checks whether date (DD.MM.YYYY) is being requested
+        """
+
+        # Determine weekday (if necessary)
+        if weekdays is not None and weekday is None:
+            weekday = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag'][datetime.strptime(date, '%d.%m.%Y').weekday()]
+
+        if weekdays is not None and weekday not in weekdays:
+            return False
+
+        if dates is not None and date not in dates:
+            return False
+
+        return True
+
+
+    def reverse_date(self, string: str, separator: str='-', delimiter: str='.') -> str:
         """
         Reverts a given date using `separator` as separator
         """
 
-        return separator.join(reversed(string.split('.')))
+        return separator.join(reversed(string.split(delimiter)))
 
 
     def format_person(self, data: list) -> str:
@@ -263,27 +360,222 @@ class Sitzungsdienst:
         return '; '.join(people)
 
 
+    def extract_pages(self, pdf_file: BufferedReader, first: int = 0, last: int = None):
+        """
+        Extracts text from PDF file using the selected backend,
+        yielding each page (from `first` up to `last`, if given)
+        as list of strings, while counting them
+        """
+
+        for page in self.backend.extract_pages(pdf_file, self.cache, first, last):
+            self.extracted += 1
+
+            yield page
+
+
+    def live_tokens(self, page: list) -> list:
+        """
+        Extracts text blocks between starting & terminal point of page
+        """
+
+        # Create data array
+        tokens = []
+
+        # Reset mode
+        is_live = False
+
+        for text in page:
+            # Determine starting & terminal point
+            if text in ['Anfahrt', 'Seite']:
+                is_live = text == 'Anfahrt'
+
+                continue
+
+            # Enforce entries between them
+            if not is_live or 'Ende der Auflistung' in text:
+                continue
+
+            tokens.append(text)
+
+        return tokens
+
+
+    def session_state(self, tokens: list) -> tuple:
+        """
+        Determines whether sessions of current court have started
+        & whether the last one still lacks its assignee
+        """
+
+        # Initialize state
+        started, unassigned = False, False
+
+        for text in tokens:
+            # Reset state for each date & court
+            if text in ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag'] or self.is_court(text):
+                started, unassigned = False, False
+
+            # Start (another) session at each time or docket number ..
+            elif self.is_time(text) or self.is_docket(text):
+                started, unassigned = True, True
+
+            # .. being assigned upon each person
+            elif self.is_person(text):
+                unassigned = False
+
+        return (started, unassigned)
+
+
+    def session_end(self, tokens: list, state: tuple) -> int:
+        """
+        Determines index of first text block not belonging to the
+        session in progress (if any), given its `state`
+        """
+
+        started, unassigned = state
+
+        # If no session is in progress, nothing belongs to it
+        if not started:
+            return 0
+
+        for index, text in enumerate(tokens):
+            # Session ends after its assignee(s) ..
+            if unassigned:
+                if self.is_person(text):
+                    unassigned = False
+
+                continue
+
+            # .. once another date, court, time or docket number follows
+            if text in ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag'] or self.is_court(text) or self.is_time(text) or self.is_docket(text):
+                return index
+
+        return None
+
+
+    def carry_over(self, pdf_file: BufferedReader, first: int) -> list:
+        """
+        Determines text blocks of the date carrying over to
+        page `first` (starting with its weekday & date),
+        scanning the preceding pages backwards
+        """
+
+        # Create data array
+        tokens = []
+
+        for number in reversed(range(first)):
+            # Prepend text blocks of page
+            page = self.live_tokens(next(self.extract_pages(pdf_file, number, number + 1), []))
+            tokens = page + tokens
+
+            for index in reversed(range(len(page))):
+                # Look for last weekday ..
+                if page[index] in ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']:
+                    # .. which starts current date
+                    return tokens[index:]
+
+        return []
+
+
+    def carry_header(self, tokens: list) -> list:
+        """
+        Reduces text blocks of the date carrying over to its
+        weekday & date, followed by the current court & place
+        """
+
+        # Determine position of current court (if any)
+        start = 2
+
+        for index, text in enumerate(tokens):
+            if self.is_court(text):
+                start = index
+
+        # Keep court & place, up to its first session
+        header = tokens[:2]
+
+        for text in tokens[start:]:
+            if self.is_time(text) or self.is_docket(text):
+                break
+
+            header.append(text)
+
+        return header
+
+
+    def extract_range(self, pdf_file: BufferedReader, first: int, last: int = None) -> list:
+        """
+        Extracts text from PDF file, combining pages from `first` up to `last`
+        into a single page, carrying over date & court from previous pages,
+        skipping the session started before them & completing the one
+        continuing after them
+        """
+
+        # Determine date carrying over
+        context = self.carry_over(pdf_file, first)
+
+        # Combine text blocks of pages
+        tokens = [text for page in self.extract_pages(pdf_file, first, last) for text in self.live_tokens(page)]
+
+        # Skip remainder of session started before first page
+        start = self.session_end(tokens, self.session_state(context))
+        tokens = self.carry_header(context) + (tokens[start:] if start is not None else [])
+
+        # If session continues after last page ..
+        if last is not None and start is not None:
+            # .. complete it using the following pages
+            state = self.session_state(tokens)
+            tail = []
+
+            for page in self.extract_pages(pdf_file, last):
+                tail += self.live_tokens(page)
+
+                end = self.session_end(tail, state)
+
+                if end is not None:
+                    tail = tail[:end]
+
+                    break
+
+            tokens += tail
+
+        return [['Anfahrt'] + tokens]
+
+
     def extract_data(self, pdf_file: BufferedReader) -> list:
         """
         Extracts data from PDF file, utilizing all of the
         above functions & returning the processed results
         """
 
-        # Import library
-        import PyPDF2
+        # If page range is given ..
+        if self.page_range is not None:
+            # .. restrict extraction to it
+            pages = self.extract_range(pdf_file, self.page_range[0] - 1, self.page_range[1])
+
+        # .. otherwise process pages while extracting them
+        else:
+            pages = self.extract_pages(pdf_file)
 
-        # Create page data array
-        pages = []
+        data = self.process_records(pages, self.weekdays, self.dates)
 
-        # Fetch content from PDF file
-        for page in PyPDF2.PdfFileReader(pdf_file).pages:
-            pages.append([text.strip() for text in page.extractText().splitlines() if text])
+        # If cache is enabled ..
+        if self.cache is not None:
+            # .. store newly extracted pages
+            self.cache.save()
+
+        return data
+
+
+    def process_records(self, pages: list, weekdays: list = None, dates: list = None) -> list:
+        """
+        Processes PDF content per-page,
+        returning its data records
+        """
 
         # Create data array
         data = []
 
         # Iterate over processed source data
-        for item in self.process_data(self.process_pages(pages)):
+        for item in self.process_data(self.process_pages(pages, weekdays, dates)):
             # Create data buffer
             details = []
 
@@ -377,3 +669,77 @@ class Sitzungsdienst:
         """Determines date range for the currently stored data"""
 
         return (self.data[0]['date'], self.data[-1]['date'])
+
+
+    def digest(self) -> str:
+        """
+        Hashes contents of the stored file object
+        """
+
+        # Import library
+        from hashlib import sha256
+
+        # Create hash object
+        digest = sha256()
+
+        # Remember current position
+        position = self.input_file.tell()
+
+        # Read file in chunks, starting from the beginning
+        self.input_file.seek(0)
+
+        for chunk in iter(lambda: self.input_file.read(65536), b''):
+            digest.update(chunk)
+
+        # Restore position
+        self.input_file.seek(position)
+
+        return digest.hexdigest()
+
+
+    def page_count(self) -> int:
+        """
+        Counts pages of the stored file object,
+        without extracting any text from them
+        """
+
+        return self.backend.count_pages(self.input_file)
+
+
+    def scan_header(self) -> str:
+        """
+        Determines first date by extracting text from
+        first page only, without parsing the document
+        """
+
+        # Extract text of first page
+        page = next(self.backend.extract_pages(self.input_file), [])
+
+        for index, text in enumerate(page[:-1]):
+            # Look for first weekday ..
+            if text in ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']:
+                # .. which is followed by its date
+                return self.reverse_date(page[index + 1])
+
+        return None
+
+
+    def week(self) -> tuple:
+        """
+        Determines week (monday to friday) covered
+        by the stored file object, using its header
+        """
+
+        # Determine first date
+        first = self.scan_header()
+
+        # If there is none ..
+        if first is None:
+            # .. data is probably empty
+            return None
+
+        # Determine monday & friday of that week
+        first = datetime.strptime(first, '%Y-%m-%d')
+        monday = first - timedelta(days=first.weekday())
+
+        return (monday.strftime('%Y-%m-%d'), (monday + timedelta(days=4)).strftime('%Y-%m-%d'))
@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+from random import Random
+
+
+# Define building blocks
+WEEKDAYS = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag']
+TITLES = ['StA', "StA'in", 'OStA', "OStA'in", 'EStA', "EStA'in", 'OAA', "OAA'in", 'EOAA', 'Ref', "Ref'in"]
+LOCATIONS = ['Freiburg', 'Emmendingen', 'Lörrach', 'Waldkirch', 'Breisach', 'Müllheim', 'Titisee-Neustadt', 'Kenzingen', 'Ettenheim', 'Staufen']
+LAST_NAMES = ['Müller', 'Schmidt', 'Schneider', 'Fischer', 'Weber', 'Meyer', 'Wagner', 'Becker', 'Schulz', 'Hoffmann', 'Koch', 'Richter']
+FIRST_NAMES = ['Anna', 'Peter', 'Julia', 'Jan', 'Eva', 'Max', 'Lena', 'Paul', 'Sarah', 'Tim']
+
+
+def generate_staff(count: int, rng: Random) -> list:
+    """
+    Generates assignees as tuples of name token & title token
+    """
+
+    staff = []
+
+    for index in range(count):
+        # Build unique name, department & (optional) PhD
+        last_name = '{}{}'.format(LAST_NAMES[index % len(LAST_NAMES)], '' if index < len(LAST_NAMES) else index // len(LAST_NAMES))
+        first_name = '{}{}'.format('Dr. ' if rng.random() < 0.2 else '', rng.choice(FIRST_NAMES))
+        department = 100 + 10 * (index % 90)
+
+        staff.append(('{} ({}), {},'.format(last_name, department, first_name), rng.choice(TITLES)))
+
+    return staff
+
+
+def generate_courts(count: int) -> list:
+    """
+    Generates local (AG) & regional (LG) court names
+    """
+
+    courts = []
+
+    for index in range(count):
+        # Determine location, appending a number once all of them are used
+        location = LOCATIONS[index % len(LOCATIONS)]
+
+        if index >= len(LOCATIONS):
+            location = '{} {}'.format(location, index // len(LOCATIONS) + 1)
+
+        # Make every fifth court a regional one
+        courts.append('{} {}'.format('LG' if index % 5 == 4 else 'AG', location))
+
+    return courts
+
+
+def generate_tokens(weeks: int = 1, courts: int = 5, staff: int = 10, sessions: int = 3, start: str = '2022-01-10', seed: int = None) -> list:
+    """
+    Generates text blocks of assignments per weekday,
+    as found between 'Anfahrt' & 'Seite' in PDF files
+    """
+
+    # Initialize random number generator
+    rng = Random(seed)
+
+    # Generate courts & assignees
+    court_names = generate_courts(courts)
+    assignees = generate_staff(staff, rng)
+
+    # Determine first monday
+    monday = datetime.strptime(start, '%Y-%m-%d').date()
+    monday -= timedelta(days=monday.weekday())
+
+    # Create data array
+    tokens = []
+
+    for week in range(weeks):
+        for offset, weekday in enumerate(WEEKDAYS):
+            # Add weekday & date
+            tokens += [weekday, (monday + timedelta(weeks=week, days=offset)).strftime('%d.%m.%Y')]
+
+            for court in court_names:
+                # Add court & room
+                tokens += [court, 'Saal {}'.format(rng.randint(1, 9))]
+
+                for _ in range(rng.randint(1, sessions)):
+                    # Select assignee
+                    name, title = rng.choice(assignees)
+
+                    # Add time & docket number
+                    tokens += [
+                        '{:02d}:{:02d}'.format(rng.randint(8, 15), rng.choice([0, 15, 30, 45])),
+                        '{} Js {}/{}'.format(rng.randint(100, 999), rng.randint(1, 99999), rng.randint(18, 22)),
+                    ]
+
+                    # Mark some of them as follow-up appointments
+                    if rng.random() < 0.1:
+                        tokens.append('F')
+
+                    # Add assignee
+                    tokens += [name, title]
+
+    return tokens
+
+
+def paginate(tokens: list, page_size: int = 60) -> list:
+    """
+    Splits text blocks into pages, each of them
+    framed by header & footer like in PDF files
+    """
+
+    # Create data array
+    pages = []
+
+    # Create page buffer
+    buffer = []
+
+    for index, text in enumerate(tokens):
+        buffer.append(text)
+
+        # Keep weekday & date on the same page
+        if text in WEEKDAYS:
+            continue
+
+        # If page is full or text blocks are exhausted ..
+        if len(buffer) >= page_size or index == len(tokens) - 1:
+            # .. mark end of listing on last page
+            if index == len(tokens) - 1:
+                buffer.append('Ende der Auflistung')
+
+            # .. add header & footer
+            pages.append([
+                'Staatsanwaltschaft Freiburg',
+                'Sitzungsdienst',
+                'Termin',
+                'Anfahrt',
+            ] + buffer + [
+                'Seite',
+                '{} von'.format(len(pages) + 1),
+            ])
+
+            # .. reset buffer
+            buffer = []
+
+    return pages
+
+
+def generate_pages(weeks: int = 1, courts: int = 5, staff: int = 10, sessions: int = 3, start: str = '2022-01-10', seed: int = None, page_size: int = 60) -> list:
+    """
+    Generates synthetic PDF content per-page,
+    as extracted by text extraction backends
+    """
+
+    return paginate(generate_tokens(weeks, courts, staff, sessions, start, seed), page_size)
+
+
+def dump_pdf(pages: list, pdf_file: str, streams: int = 1) -> None:
+    """
+    Stores page contents as minimal PDF file,
+    with every text block on a separate line,
+    splitting each page into `streams` content streams
+    """
+
+    # Define helper for escaping PDF strings
+    def escape(text: str) -> bytes:
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)').encode('cp1252')
+
+    # Create objects, starting with catalog & font
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+    ]
+
+    # Create buffer for page references
+    kids = []
+
+    for page in pages:
+        # Build content, moving to the next line for every text block
+        lines = [b'BT /F1 9 Tf 11 TL 40 810 Td\n'] + [b'(' + escape(text) + b") '\n" for text in page] + [b'ET']
+
+        # Create buffer for content stream references
+        contents = []
+
+        # Split content into (roughly) equal parts
+        size = -(-len(lines) // streams)
+
+        for index in range(0, len(lines), size):
+            stream = b''.join(lines[index:index + size])
+
+            # Add content stream
+            objects.append(b'<< /Length ' + str(len(stream)).encode() + b' >>\nstream\n' + stream + b'\nendstream')
+            contents.append('{} 0 R'.format(len(objects)))
+
+        # Add page object
+        objects.append('<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 3 0 R >> >> /Contents {} >>'.format(contents[0] if len(contents) == 1 else '[{}]'.format(' '.join(contents))).encode())
+
+        kids.append('{} 0 R'.format(len(objects)))
+
+    # Add page tree
+    objects[1] = '<< /Type /Pages /Kids [{}] /Count {} >>'.format(' '.join(kids), len(kids)).encode()
+
+    # Assemble document, keeping track of object offsets
+    document = b'%PDF-1.4\n'
+    offsets = []
+
+    for number, content in enumerate(objects, start=1):
+        offsets.append(len(document))
+        document += str(number).encode() + b' 0 obj\n' + content + b'\nendobj\n'
+
+    # Add cross-reference table & trailer
+    xref = len(document)
+    document += 'xref\n0 {}\n0000000000 65535 f \n'.format(len(objects) + 1).encode()
+    document += b''.join(['{:010d} 00000 n \n'.format(offset).encode() for offset in offsets])
+    document += 'trailer\n<< /Size {} /Root 1 0 R >>\nstartxref\n{}\n%%EOF\n'.format(len(objects) + 1, xref).encode()
+
+    # Write data to PDF file
+    with open(pdf_file, 'wb') as file:
+        file.write(document)
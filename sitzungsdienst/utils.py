@@ -42,16 +42,17 @@ def load_json(json_file: BufferedReader):
         raise Exception
 
 
-def dump_csv(data: list, csv_file: str) -> None:
+def dump_csv(data: list, csv_file: str, columns: list = None) -> None:
     """
-    Stores data as given CSV file
+    Stores data as given CSV file, optionally
+    using `columns` (eg as header of empty data)
     """
 
     # Import library
     from pandas import DataFrame
 
     # Write data to CSV file
-    dataframe = DataFrame(data)
+    dataframe = DataFrame(data, columns = columns)
     dataframe.to_csv(csv_file, index = False)
 
 
@@ -68,9 +69,41 @@ def dump_json(data: list, json_file: str, indent: int = 4) -> None:
         dump(data, file, ensure_ascii = False, indent = indent)
 
 
-def data2calendar(data: list, duration: int = 1):
+def dump_jsonl(data, jsonl_file: str, compress: bool = False, fast: bool = False) -> None:
     """
-    Converts data to iCalendar text
+    Streams data as given JSON Lines file,
+    writing one compact record per line
+    """
+
+    # Import libraries
+    import gzip
+    from json import dumps
+
+    # Define default encoder
+    def encode(item) -> bytes:
+        return dumps(item, ensure_ascii = False, separators = (',', ':')).encode('utf-8')
+
+    # If enabled ..
+    if fast:
+        # .. attempt to ..
+        try:
+            # .. use faster encoder
+            from orjson import dumps as encode
+
+        # .. otherwise keep default encoder
+        except ImportError:
+            pass
+
+    # Write data to (compressed) JSON Lines file
+    with (gzip.open if compress else open)(jsonl_file, 'wb') as file:
+        for item in data:
+            file.write(encode(item) + b'\n')
+
+
+def data2calendar(data: list, duration: int = 1, status: str = None):
+    """
+    Converts data to iCalendar text, optionally
+    setting `status` (eg 'CANCELLED') of all events
     """
 
     # Import libraries
@@ -121,7 +154,8 @@ def data2calendar(data: list, duration: int = 1):
             created = datetime.now(timezone),
             begin = begin,
             end = end,
-            location = item['where']
+            location = item['where'],
+            status = status,
         )
 
         # Add assignee(s) as attendee(s)
@@ -155,3 +189,26 @@ def dump_ics(data: list, ics_file: str) -> None:
     # Write calendar object to ICS file
     with open(ics_file, 'w') as file:
         file.writelines(data2calendar(data))
+
+
+def dump_data(data: list, output_file: str, file_format: str = 'csv', compress: bool = False, fast: bool = False) -> None:
+    """
+    Stores data as given file, using `file_format`
+    """
+
+    # Write data as ..
+    if file_format == 'csv':
+        # (1) .. CSV
+        dump_csv(data, output_file)
+
+    if file_format == 'json':
+        # (2) .. JSON
+        dump_json(data, output_file)
+
+    if file_format == 'ndjson':
+        # (3) .. JSON Lines
+        dump_jsonl(data, output_file, compress, fast)
+
+    if file_format == 'ics':
+        # (4) .. ICS
+        dump_ics(data, output_file)
@@ -0,0 +1,32 @@
+import pytest
+
+from sitzungsdienst.backends import Backend
+
+
+class DummyBackend(Backend):
+    """
+    Serves given pages (as lists of strings) instead of
+    reading PDF files, counting each text extraction
+    """
+
+    name = 'dummy'
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = 0
+
+    def load_pages(self, pdf_file):
+        return iter(self.pages)
+
+    def extract_text(self, page):
+        self.calls += 1
+
+        return '\n'.join(page)
+
+    def load_content(self, page):
+        return '\n'.join(page).encode('utf-8')
+
+
+@pytest.fixture
+def dummy_backend():
+    return DummyBackend
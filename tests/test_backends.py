@@ -0,0 +1,69 @@
+import pytest
+
+from sitzungsdienst.backends import BACKENDS, Backend, get_backend
+from sitzungsdienst.bench import benchmark_backend
+from sitzungsdienst.sta import Sitzungsdienst
+from sitzungsdienst.synthetic import dump_pdf, generate_pages
+from sitzungsdienst.utils import dedupe, dump_json
+
+
+def test_get_backend():
+    # Loop over available backends
+    for name in BACKENDS:
+        # Assert result
+        assert get_backend(name.upper()).name == name
+
+    # Assert exception
+    with pytest.raises(ValueError):
+        get_backend('invalid')
+
+
+def test_tokenize():
+    # Run function
+    result = get_backend().tokenize('  Anfahrt \n\nMontag\n 10.01.2022\n')
+
+    # Assert result
+    assert result == ['Anfahrt', 'Montag', '10.01.2022']
+
+
+def test_incomplete_backend():
+    # Define backend lacking content stream access
+    class IncompleteBackend(Backend):
+        name = 'incomplete'
+
+        def load_pages(self, pdf_file):
+            return []
+
+        def extract_text(self, page):
+            return ''
+
+    # Assert exception
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+def test_benchmark_backend(tmp_path):
+    # Setup
+    pdf_file = tmp_path / 'kw02.pdf'
+    dump_pdf(generate_pages(weeks=1, seed=1, page_size=30), str(pdf_file))
+
+    # Run function
+    report = benchmark_backend('pypdf2', [str(pdf_file)], str(tmp_path / 'fixtures'), rounds=1)
+
+    # Assert result, reporting missing fixture
+    assert report['unchecked'] == ['kw02']
+    assert report['passed'] + report['failed'] == []
+
+    # Create fixture
+    fixture = tmp_path / 'fixtures' / 'kw02' / 'file_format.json'
+    fixture.parent.mkdir(parents=True)
+
+    with open(pdf_file, 'rb') as file:
+        dump_json(dedupe(Sitzungsdienst(file).data), str(fixture))
+
+    # Run function
+    report = benchmark_backend('pypdf2', [str(pdf_file)], str(tmp_path / 'fixtures'), rounds=1)
+
+    # Assert result
+    assert report['passed'] == ['kw02']
+    assert report['unchecked'] == []
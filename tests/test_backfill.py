@@ -0,0 +1,96 @@
+from operator import itemgetter
+
+import pytest
+
+from sitzungsdienst.backfill import Backfill
+from sitzungsdienst.sta import Sitzungsdienst
+from sitzungsdienst.synthetic import dump_pdf, generate_pages
+
+
+def parse(pdf_files, backend='pypdf2'):
+    # Combine records of all files
+    data = []
+
+    for pdf_file in pdf_files:
+        with open(pdf_file, 'rb') as file:
+            data += Sitzungsdienst(file, backend).data
+
+    return sorted(data, key=itemgetter('date', 'who', 'when', 'where', 'what'))
+
+
+def test_backfill(tmp_path):
+    # Setup
+    pdf_files = []
+
+    for seed in range(3):
+        pdf_file = str(tmp_path / 'kw{:02d}.pdf'.format(seed))
+        dump_pdf(generate_pages(weeks=1, seed=seed, page_size=30), pdf_file)
+
+        pdf_files.append(pdf_file)
+
+    state_dir = tmp_path / '.backfill'
+
+    # Test 1 :: Interrupted run
+    def interrupt(done, total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        Backfill(state_dir).run(pdf_files, jobs=1, chunk_size=1, callback=interrupt)
+
+    # Assert result, first chunk being checkpointed
+    job = Backfill(state_dir)
+
+    assert list(job.manifest) == pdf_files[:1]
+
+    # Test 2 :: Resuming run
+    progress = []
+
+    assert job.run(pdf_files, jobs=1, chunk_size=1, callback=lambda done, total: progress.append((done, total))) == []
+
+    # Assert result, processing remaining files only
+    assert progress == [(1, 2), (2, 2)]
+    assert job.merge(pdf_files) == parse(pdf_files)
+
+    # Test 3 :: Changed file
+    dump_pdf(generate_pages(weeks=1, seed=3, page_size=30), pdf_files[1])
+
+    job = Backfill(state_dir)
+    progress = []
+
+    assert job.run(pdf_files, jobs=1, callback=lambda done, total: progress.append((done, total))) == []
+
+    # Assert result, reprocessing changed file only
+    assert progress == [(1, 1)]
+    assert job.merge(pdf_files) == parse(pdf_files)
+
+    # Test 4 :: Failing file
+    with open(pdf_files[2], 'wb') as file:
+        file.write(b'not a PDF file')
+
+    job = Backfill(state_dir)
+    errors = job.run(pdf_files, jobs=1)
+
+    # Assert result, dropping results of previous version
+    assert [pdf_file for pdf_file, error in errors] == [pdf_files[2]]
+    assert pdf_files[2] not in Backfill(state_dir).manifest
+    assert job.merge(pdf_files) == parse(pdf_files[:2])
+
+    # Test 5 :: Retrying failed file
+    dump_pdf(generate_pages(weeks=1, seed=2, page_size=30), pdf_files[2])
+
+    job = Backfill(state_dir)
+
+    # Assert result
+    assert job.run(pdf_files, jobs=1) == []
+    assert job.merge(pdf_files) == parse(pdf_files)
+
+    # Test 6 :: Other backend
+    job = Backfill(state_dir, 'pdfminer')
+    progress = []
+
+    assert job.run(pdf_files, jobs=1, callback=lambda done, total: progress.append((done, total))) == []
+
+    # Assert result, reprocessing all files
+    assert progress == [(3, 3)]
+    assert job.merge(pdf_files) == parse(pdf_files, 'pdfminer')
+    assert all(entry['backend'] == 'pdfminer' for entry in Backfill(state_dir).manifest.values())
@@ -0,0 +1,54 @@
+from sitzungsdienst.backends import BACKENDS, get_backend
+from sitzungsdienst.cache import PageCache
+from sitzungsdienst.synthetic import dump_pdf, generate_pages
+
+
+def test_page_cache(tmp_path, dummy_backend):
+    # Define cache file
+    cache_file = tmp_path / 'pages.json'
+
+    # Setup
+    backend = dummy_backend([['Anfahrt', 'Montag'], ['Seite']])
+    cache = PageCache(cache_file)
+
+    # Run function
+    pages = list(backend.extract_pages(None, cache))
+    cache.save()
+
+    # Assert result
+    assert pages == [['Anfahrt', 'Montag'], ['Seite']]
+    assert backend.calls == 2
+
+    # Re-issue document with one corrected page
+    backend = dummy_backend([['Anfahrt', 'Montag'], ['Seite 1']])
+    cache = PageCache(cache_file)
+
+    # Run function
+    pages = list(backend.extract_pages(None, cache))
+
+    # Assert result
+    assert pages == [['Anfahrt', 'Montag'], ['Seite 1']]
+    assert backend.calls == 1
+    assert cache.modified
+
+
+def test_page_cache_streams(tmp_path):
+    # Setup
+    pages = generate_pages(weeks=1, seed=1, page_size=30)
+
+    dump_pdf(pages, str(tmp_path / 'single.pdf'))
+    dump_pdf(pages, str(tmp_path / 'multiple.pdf'), streams=3)
+
+    # Loop over available backends
+    for name in BACKENDS:
+        backend = get_backend(name)
+
+        # Run function
+        with open(tmp_path / 'single.pdf', 'rb') as file:
+            expected = list(backend.extract_pages(file))
+
+        with open(tmp_path / 'multiple.pdf', 'rb') as file:
+            result = list(backend.extract_pages(file, PageCache(tmp_path / '{}.json'.format(name))))
+
+        # Assert result, combining content streams per page
+        assert result == expected
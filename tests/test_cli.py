@@ -4,6 +4,16 @@ import json
 
 from click.testing import CliRunner
 from sitzungsdienst.cli import cli
+from sitzungsdienst.intervals import IntervalIndex
+from sitzungsdienst.sta import Sitzungsdienst
+from sitzungsdienst.synthetic import dump_pdf, generate_pages
+
+
+def synthetic_pdf(pdf_file, seed=1):
+    # Store synthetic document
+    dump_pdf(generate_pages(weeks=1, seed=seed, page_size=30), str(pdf_file))
+
+    return str(pdf_file)
 
 
 def test_cli_no_argument():
@@ -192,3 +202,252 @@ def test_cli(tmp_path):
                     expected = data_file.readlines()
 
                 assert created == expected
+
+
+def test_cli_jobs(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    pdf_file = synthetic_pdf(tmp_path / 'kw02.pdf')
+
+    # Create file with test data, with colliding output files
+    inquiries_file = tmp_path / 'inquiries.json'
+
+    inquiries_file.write_text(json.dumps([
+        {'output': 'me', 'query': ['StA']},
+        {'output': 'all', 'query': []},
+        {'output': 'Me', 'query': ['Ref']},
+        {'output': 'none', 'query': ['999']},
+    ]))
+
+    # Create buffer for created files
+    created = {}
+
+    # Loop over writing serially & in parallel
+    for args in [['-j', '1'], ['-j', '3', '--pool', 'thread'], ['-j', '3', '--pool', 'process']]:
+        path = tmp_path / '-'.join(args)
+
+        # Run function
+        result = runner.invoke(cli, args + ['-i', str(inquiries_file), '-f', 'json', '-d', str(path), '--no-metrics', '-v', pdf_file])
+
+        # Assert result, reporting files in order
+        assert result.exit_code == 0
+        assert [line for line in result.output.splitlines() if line.startswith('Saving')] == [
+            'Saving file as "{}" .. done.'.format(path / name) for name in ['all.json', 'me.json']
+        ]
+
+        # Assert existence, last request winning
+        assert sorted(file.name for file in path.iterdir()) == ['all.json', 'me.json']
+
+        with open(path / 'me.json', 'r') as file:
+            assert all('Ref' in item['who'] for item in json.load(file))
+
+        created[tuple(args)] = {file.name: file.read_text() for file in path.iterdir()}
+
+    # Assert same results
+    assert len({json.dumps(files, sort_keys=True) for files in created.values()}) == 1
+
+    # Run function, using processes for ICS files by default
+    result = runner.invoke(cli, ['-j', '3', '-i', str(inquiries_file), '-f', 'ics', '-d', str(tmp_path / 'ics'), '--no-metrics', pdf_file])
+
+    # Assert existence
+    assert result.exit_code == 0
+    assert sorted(file.name for file in (tmp_path / 'ics').iterdir()) == ['all.ics', 'me.ics']
+
+
+def test_cli_errors(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    pdf_file = synthetic_pdf(tmp_path / 'kw02.pdf')
+
+    # Create file with test data, with one unwritable output file
+    inquiries_file = tmp_path / 'inquiries.json'
+
+    inquiries_file.write_text(json.dumps([
+        {'output': 'missing/me', 'query': []},
+        {'output': 'all', 'query': []},
+    ]))
+
+    # Loop over writing serially & in parallel
+    for jobs in ['1', '2']:
+        path = tmp_path / jobs
+
+        # Run function
+        result = runner.invoke(cli, ['-j', jobs, '-i', str(inquiries_file), '-d', str(path), '--no-metrics', pdf_file])
+
+        # Assert result, writing remaining files
+        assert result.exit_code != 0
+        assert 'Writing "{}" failed'.format(path / 'missing' / 'me.csv') in result.stderr
+        assert (path / 'all.csv').exists()
+
+
+def test_cli_check(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    pdf_file = synthetic_pdf(tmp_path / 'kw02.pdf')
+
+    with open(pdf_file, 'rb') as file:
+        index = IntervalIndex(Sitzungsdienst(file).data)
+
+    # Test 1 :: Conflicts
+    result = runner.invoke(cli, ['check', pdf_file])
+
+    # Assert result
+    assert result.exit_code == 0
+    assert index.conflicts()
+    assert len(result.stdout.splitlines()) == len(index.conflicts())
+
+    # Test 2 :: Available assignees
+    result = runner.invoke(cli, ['check', pdf_file, '-f', '2022-01-10', '9:00'])
+
+    # Assert result
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == index.free('2022-01-10', '09:00')
+
+    # Test 3 :: Invalid date & time
+    for args in [['2022-01-10', '9am'], ['10.01.2022', '09:00']]:
+        result = runner.invoke(cli, ['check', pdf_file, '-f'] + args)
+
+        # Assert exception
+        assert result.exit_code == 2
+        assert 'Invalid value' in result.stderr
+
+
+def test_cli_restrictions(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    pdf_file = synthetic_pdf(tmp_path / 'kw02.pdf')
+
+    # Test 1 :: Valid restrictions
+    for args in [['--pages', '2'], ['--pages', '2-3'], ['--pages', '2-'], ['-t', '2022-01-11']]:
+        # Run function
+        result = runner.invoke(cli, args + ['-d', str(tmp_path), '--no-metrics', pdf_file])
+
+        # Assert result
+        assert result.exit_code == 0
+
+    # Test 2 :: Invalid restrictions
+    for args in [['--pages', '0'], ['--pages', '0-2'], ['--pages', '3-2'], ['--pages', 'x'], ['-t', '2022-13-45'], ['-t', '11.01.2022']]:
+        # Run function
+        result = runner.invoke(cli, args + ['-d', str(tmp_path), '--no-metrics', pdf_file])
+
+        # Assert exception
+        assert result.exit_code == 2
+        assert 'Invalid value' in result.stderr
+
+
+def test_cli_metrics(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    pdf_file = synthetic_pdf(tmp_path / 'kw02.pdf')
+    metrics_file = str(tmp_path / 'metrics.jsonl')
+
+    # Assert empty history
+    result = runner.invoke(cli, ['metrics', '-m', metrics_file])
+
+    assert result.output == 'No metrics found!\n'
+
+    # Run function
+    for args in [[], ['--pages', '2'], ['-b', 'pypdf']]:
+        result = runner.invoke(cli, args + ['-d', str(tmp_path), '-m', metrics_file, pdf_file])
+
+    result = runner.invoke(cli, ['metrics', '-m', metrics_file, '-w', '1'])
+
+    # Assert result, counting extracted pages only
+    lines = [line for line in result.stdout.splitlines() if not line.startswith('  SLOW')]
+
+    assert result.exit_code == 0
+    pages = [int(line.split(': ')[1].split(' ')[0]) for line in lines[:3]]
+
+    assert pages[0] == pages[2] == len(generate_pages(weeks=1, seed=1, page_size=30))
+    assert pages[1] < pages[0]
+
+    # Assert trend, comparing runs of last backend only
+    assert not lines[3:]
+
+    result = runner.invoke(cli, ['-b', 'pypdf', '-d', str(tmp_path), '-m', metrics_file, pdf_file])
+    result = runner.invoke(cli, ['metrics', '-m', metrics_file, '-w', '1'])
+
+    assert result.stdout.splitlines()[-1].startswith('Trend: ')
+    assert result.stdout.splitlines()[-1].endswith(' over the last 1 runs (pypdf, uncached)')
+
+
+def test_cli_backfill(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    archive = tmp_path / 'archive'
+    archive.mkdir()
+
+    for seed in range(3):
+        synthetic_pdf(archive / 'kw{:02d}.pdf'.format(seed), seed)
+
+    args = ['backfill', str(archive), '-f', 'json', '-d', str(tmp_path / 'dist'), '-s', str(tmp_path / '.backfill'), '-j', '1', '-n', '2', '-v']
+
+    # Run function
+    result = runner.invoke(cli, args)
+
+    # Assert result
+    assert result.exit_code == 0
+    assert 'Processed 2 of 3 remaining files.' in result.output
+    assert 'Processed 3 of 3 remaining files.' in result.output
+
+    with open(tmp_path / 'dist' / 'backfill.json', 'r') as file:
+        data = json.load(file)
+
+    assert {item['date'] for item in data} >= {'2022-01-10', '2022-01-14'}
+
+    # Run function, with one file failing
+    (archive / 'kw01.pdf').write_bytes(b'not a PDF file')
+
+    result = runner.invoke(cli, args)
+
+    # Assert result, processing changed file only
+    assert result.exit_code != 0
+    assert 'Processed 1 of 1 remaining files.' in result.output
+    assert 'Processing "{}" failed'.format(archive / 'kw01.pdf') in result.stderr
+
+    with open(tmp_path / 'dist' / 'backfill.json', 'r') as file:
+        assert len(json.load(file)) < len(data)
+
+
+def test_cli_diff(tmp_path):
+    runner = CliRunner()
+
+    # Setup
+    old = synthetic_pdf(tmp_path / 'old.pdf', 1)
+    new = synthetic_pdf(tmp_path / 'new.pdf', 2)
+
+    for ext in ['csv', 'ics', 'json', 'ndjson']:
+        # Define filepath
+        file = tmp_path / 'dist' / 'diff.{}'.format(ext)
+
+        # Test 1 :: Changes
+        result = runner.invoke(cli, ['diff', old, new, '-f', ext, '-d', str(tmp_path / 'dist')])
+
+        # Assert result
+        assert result.exit_code == 0
+        assert len(file.read_text().splitlines()) > 1
+
+        # Test 2 :: No changes, replacing stale file
+        result = runner.invoke(cli, ['diff', old, old, '-f', ext, '-d', str(tmp_path / 'dist'), '-v'])
+
+        # Assert result
+        assert result.exit_code == 0
+        assert 'No changes found!' in result.output
+
+        expected = {
+            'csv': 'change,date,when,who,where,what,previous\n',
+            'json': '[]',
+            'ndjson': '',
+        }
+
+        if ext in expected:
+            assert file.read_text() == expected[ext]
+
+        else:
+            assert 'BEGIN:VEVENT' not in file.read_text()
@@ -0,0 +1,53 @@
+from sitzungsdienst.diff import diff2calendar, diff_records
+from sitzungsdienst.utils import data2calendar
+
+
+def test_diff_records():
+    # Define test data
+    old = [
+        {'date': '2022-01-10', 'when': '09:00', 'who': "StA'in Anna Müller (210)", 'where': 'AG Freiburg Saal 1', 'what': '210 Js 1/22'},
+        {'date': '2022-01-10', 'when': '10:00', 'who': 'Ref Peter Schmidt (520)', 'where': 'AG Freiburg Saal 1', 'what': '520 Js 2/22'},
+        {'date': '2022-01-11', 'when': '09:00', 'who': 'OStA Jan Weber (850)', 'where': 'LG Freiburg Saal 3', 'what': '850 Js 3/22'},
+    ]
+
+    new = [
+        {'date': '2022-01-10', 'when': '09:00', 'who': "StA'in Anna Müller (210)", 'where': 'AG Freiburg Saal 1', 'what': '210 Js 1/22'},
+        {'date': '2022-01-10', 'when': '10:00', 'who': 'OStA Jan Weber (850)', 'where': 'AG Freiburg Saal 1', 'what': '520 Js 2/22'},
+        {'date': '2022-01-12', 'when': '11:00', 'who': 'Ref Peter Schmidt (520)', 'where': 'AG Emmendingen', 'what': '520 Js 4/22'},
+    ]
+
+    # Run function
+    changes = diff_records(old, new)
+
+    # Assert result
+    assert [(item['change'], item['what'], item['who'], item['previous']) for item in changes] == [
+        ('reassigned', '520 Js 2/22', 'OStA Jan Weber (850)', 'Ref Peter Schmidt (520)'),
+        ('removed', '850 Js 3/22', '', 'OStA Jan Weber (850)'),
+        ('added', '520 Js 4/22', 'Ref Peter Schmidt (520)', ''),
+    ]
+
+    # Assert unchanged data
+    assert diff_records(new, list(reversed(new))) == []
+
+
+def test_diff2calendar():
+    # Define test data, with two records per session
+    old = [
+        {'date': '2022-01-10', 'when': '09:00', 'who': "StA'in Anna Müller (210)", 'where': 'AG Freiburg Saal 1', 'what': '210 Js 1/22'},
+        {'date': '2022-01-10', 'when': '09:00', 'who': 'Ref Peter Schmidt (520)', 'where': 'AG Freiburg Saal 1', 'what': '210 Js 1/22'},
+    ]
+
+    # Run function
+    changes = diff_records(old, old[:1])
+
+    # Assert result
+    assert [(item['change'], item['who'], item['previous']) for item in changes] == [
+        ('reassigned', '', 'Ref Peter Schmidt (520)'),
+    ]
+
+    # Assert cancellation of original event only
+    calendar = diff2calendar(changes)
+
+    assert [(event.uid, event.status) for event in calendar.events] == [
+        (event.uid, 'CANCELLED') for event in data2calendar(old[1:]).events
+    ]
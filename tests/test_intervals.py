@@ -0,0 +1,27 @@
+from sitzungsdienst.intervals import IntervalIndex
+
+
+def test_interval_index():
+    # Define test data
+    data = [
+        {'date': '2022-01-10', 'when': '09:00', 'who': "StA'in Anna Müller (210)", 'where': 'AG Freiburg Saal 1', 'what': '210 Js 1/22'},
+        {'date': '2022-01-10', 'when': '09:30', 'who': "StA'in Anna Müller (210)", 'where': 'AG Freiburg Saal 1', 'what': '210 Js 2/22'},
+        {'date': '2022-01-10', 'when': '09:45', 'who': "StA'in  Anna Müller (210)", 'where': 'AG Emmendingen Saal 2', 'what': '210 Js 3/22'},
+        {'date': '2022-01-10', 'when': '11:00', 'who': 'Ref Peter Schmidt (520)', 'where': 'LG Freiburg Saal 3', 'what': '520 Js 4/22'},
+        {'date': '2022-01-11', 'when': '', 'who': 'OStA Jan Weber (850)', 'where': 'AG Lörrach', 'what': ''},
+    ]
+
+    # Run function
+    index = IntervalIndex(data, duration=1)
+
+    # Assert results
+    conflicts = index.conflicts()
+
+    assert len(conflicts) == 2
+    assert {conflict['first']['what'] for conflict in conflicts} == {'210 Js 1/22', '210 Js 2/22'}
+    assert {conflict['second']['what'] for conflict in conflicts} == {'210 Js 3/22'}
+
+    assert index.free('2022-01-10', '08:00') == ['Ref Peter Schmidt (520)', "StA'in Anna Müller (210)"]
+    assert index.free('2022-01-10', '10:30') == []
+    assert index.free('2022-01-10', '11:00') == ["StA'in Anna Müller (210)"]
+    assert index.free('2022-01-10', '12:00') == ['Ref Peter Schmidt (520)', "StA'in Anna Müller (210)"]
@@ -0,0 +1,55 @@
+from sitzungsdienst.metrics import RunMetrics, append_metrics, find_regressions, find_trend, load_metrics
+
+
+def test_metrics(tmp_path):
+    # Define metrics file
+    metrics_file = tmp_path / 'metrics.jsonl'
+
+    # Assert empty history
+    assert load_metrics(metrics_file) == []
+
+    # Run function
+    metrics = RunMetrics(source = 'kw01.pdf')
+
+    with metrics.stage('parse'):
+        pass
+
+    record = metrics.finish(pages = 3, records = 10)
+    append_metrics(record, metrics_file)
+
+    # Assert result
+    history = load_metrics(metrics_file)
+
+    assert history == [record]
+    assert set(history[0]['stages']) == {'parse'}
+    assert history[0]['duration'] >= history[0]['stages']['parse']
+
+
+def test_find_regressions():
+    # Define history, with one slow run
+    history = [{'pages': 10, 'backend': 'pypdf2', 'stages': {'parse': duration}, 'duration': 10.0} for duration in [1.0, 1.1, 0.9, 1.0, 3.0, 1.0, 0.0]]
+    history.append({'pages': 0, 'backend': 'pypdf2', 'stages': {'parse': 5.0}, 'duration': 5.0})
+
+    # Add runs of slower backend, restricted to fewer pages
+    history += [{'pages': 2, 'backend': 'pdfminer', 'stages': {'parse': 2.0}, 'duration': 2.0} for _ in range(4)]
+
+    # Run function
+    regressions = find_regressions(history, window = 3, threshold = 1.5)
+
+    # Assert result
+    assert [item['record'] for item in regressions] == [history[4]]
+    assert round(regressions[0]['factor'], 2) == 3.0
+
+
+def test_find_trend():
+    # Define history, with uncached runs getting faster ..
+    history = [{'pages': 10, 'backend': 'pypdf2', 'cached': False, 'stages': {'parse': duration}} for duration in [2.0, 2.0, 1.0, 1.0]]
+
+    # .. being interleaved with (much faster) cached runs
+    history = [item for record in history for item in [record, {'pages': 10, 'backend': 'pypdf2', 'cached': True, 'stages': {'parse': 0.1}}]]
+
+    # Assert result, using runs comparable to the last one
+    assert find_trend([], window = 2) is None
+    assert find_trend(history, window = 3) is None
+    assert find_trend(history, window = 2) == 0.0
+    assert find_trend(history[:-1], window = 2) == 1.0
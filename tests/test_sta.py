@@ -0,0 +1,67 @@
+from hashlib import sha256
+from io import BytesIO
+
+from sitzungsdienst.sta import Sitzungsdienst
+from sitzungsdienst.synthetic import generate_pages
+
+
+def test_lazy(dummy_backend):
+    # Setup
+    pages = generate_pages(weeks=1, seed=1, page_size=30)
+    source = BytesIO(b'%PDF-1.4 dummy')
+
+    sta = Sitzungsdienst(source)
+    sta.backend = dummy_backend(pages)
+
+    # Assert results, without parsing
+    assert sta.week() == ('2022-01-10', '2022-01-14')
+    assert sta.page_count() == len(pages)
+    assert sta.digest() == sha256(b'%PDF-1.4 dummy').hexdigest()
+    assert sta.backend.calls == 1
+
+    # Assert results, after parsing once
+    assert sta.data == Sitzungsdienst.from_pages(pages).data
+    assert sta.data
+    assert sta.backend.calls == 1 + len(pages)
+
+
+def test_selective(dummy_backend):
+    # Setup
+    pages = generate_pages(weeks=2, seed=1, page_size=30)
+    data = Sitzungsdienst.from_pages(pages).data
+
+    # Test 1 :: Weekdays
+    sta = Sitzungsdienst(BytesIO())
+    sta.backend = dummy_backend(pages)
+    sta.weekdays = ['Montag', 'Dienstag']
+
+    # Assert result
+    assert sta.data == [item for item in data if item['date'] in ['2022-01-10', '2022-01-11', '2022-01-17', '2022-01-18']]
+
+    # Test 2 :: Dates, stopping early
+    sta = Sitzungsdienst(BytesIO())
+    sta.backend = dummy_backend(pages)
+    sta.dates = ['2022-01-11']
+
+    # Assert result
+    assert sta.data == [item for item in data if item['date'] == '2022-01-11']
+    assert sta.backend.calls < len(pages)
+    assert sta.extracted == sta.backend.calls
+
+    # Test 3 :: Page range, carrying over date & court from previous pages
+    for size in [1, 2]:
+        # Create buffer for records of all page ranges
+        records = []
+
+        for number in range(0, len(pages), size):
+            sta = Sitzungsdienst(BytesIO())
+            sta.backend = dummy_backend(pages)
+            sta.page_range = (number + 1, min(number + size, len(pages)))
+
+            # Assert result
+            assert all(item in data for item in sta.data)
+
+            records += sta.data
+
+        # Assert result, each session being covered exactly once
+        assert sorted(records, key=lambda item: sorted(item.items())) == sorted(data, key=lambda item: sorted(item.items()))
@@ -0,0 +1,18 @@
+from sitzungsdienst.sta import Sitzungsdienst
+from sitzungsdienst.synthetic import generate_pages, generate_tokens
+
+
+def test_synthetic():
+    # Count generated sessions
+    tokens = generate_tokens(weeks=2, courts=12, staff=30, seed=1)
+    sessions = len([text for text in tokens if Sitzungsdienst.from_pages([]).is_docket(text)])
+
+    # Loop over page sizes, forcing dates to carry over pages
+    for page_size in [20, 37, 60, 1000]:
+        # Run function
+        sta = Sitzungsdienst.from_pages(generate_pages(weeks=2, courts=12, staff=30, seed=1, page_size=page_size))
+
+        # Assert result
+        assert len(sta.data) == sessions
+        assert len({item['date'] for item in sta.data}) == 10
+        assert all(item['who'] and item['when'] and item['where'] for item in sta.data)
@@ -0,0 +1,28 @@
+import gzip
+import json
+
+from sitzungsdienst.utils import dump_jsonl
+
+
+def test_dump_jsonl(tmp_path):
+    # Define test data
+    data = [
+        {'date': '2022-01-10', 'when': '09:00', 'who': "StA'in Müller (210)"},
+        {'date': '2022-01-11', 'when': '14:30', 'who': 'Ref Schmidt (520)'},
+    ]
+
+    for compress in [False, True]:
+        for fast in [False, True]:
+            # Define filepath
+            file = tmp_path / 'data.ndjson'
+
+            # Run function, streaming from generator
+            dump_jsonl((item for item in data), file, compress, fast)
+
+            # Load created file
+            with (gzip.open if compress else open)(file, 'rt', encoding='utf-8') as data_file:
+                created = data_file.read().splitlines()
+
+            # Assert result
+            assert [json.loads(line) for line in created] == data
+            assert ' ' not in created[0].replace("StA'in Müller (210)", '')